@@ -1,11 +1,100 @@
 """Merge multi-page hymns into complete hymn objects."""
 
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Optional
 
-from hymn_ocr.models import Hymn, PageData, PageType
+from hymn_ocr.models import ISO_DATE_PATTERN, PAGE_DATA_ADAPTER, Hymn, PageData, PageType
 from hymn_ocr.repetition_detector import adjust_repetition_numbers
 
 
+# Page types that never contribute to a hymn
+_SKIP_TYPES = frozenset({PageType.COVER, PageType.BLANK})
+
+
+@dataclass
+class _HymnAccumulator:
+    """A hymn being merged; body texts are kept as parts until the Hymn is built."""
+
+    number: int
+    title: str
+    parts: list[str] = field(default_factory=list)
+    original_number: Optional[int] = None
+    style: Optional[str] = None
+    offered_to: Optional[str] = None
+    extra_instructions: Optional[str] = None
+    repetitions: Optional[str] = None
+    received_at: Optional[str] = None
+    _newline_count: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Count the newlines of the initial parts and the page breaks between them."""
+        self._newline_count = sum(part.count("\n") for part in self.parts)
+        self._newline_count += 2 * max(len(self.parts) - 1, 0)
+
+    @property
+    def text(self) -> str:
+        """Body text so far, with pages separated by a blank line."""
+        return "\n\n".join(self.parts)
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines in text, tracked without joining the parts."""
+        return self._newline_count + 1
+
+    def add_part(self, body_text: str) -> None:
+        """Append the body text of another page."""
+        if self.parts:
+            # Blank line between pages
+            self._newline_count += 2
+        self._newline_count += body_text.count("\n")
+        self.parts.append(body_text)
+
+    def to_hymn(self) -> Hymn:
+        """
+        Build the Hymn, joining the text parts once.
+
+        Page fields were already validated as PageData, so when the Hymn
+        constraints visibly hold the model is built without re-validation.
+        Anything else goes through full validation, which raises on bad data.
+
+        Returns:
+            The merged Hymn.
+        """
+        text = self.text
+        if (
+            self.number > 0
+            and self.title
+            and text
+            and (self.original_number is None or self.original_number > 0)
+            and (self.received_at is None or ISO_DATE_PATTERN.match(self.received_at))
+        ):
+            # Mirror Hymn's validators: lengths are checked before stripping
+            return Hymn.model_construct(
+                number=self.number,
+                title=self.title.strip(),
+                text=text.strip(),
+                original_number=self.original_number,
+                style=self.style,
+                offered_to=self.offered_to,
+                extra_instructions=self.extra_instructions,
+                repetitions=self.repetitions,
+                received_at=self.received_at,
+            )
+
+        return Hymn(
+            number=self.number,
+            title=self.title,
+            text=text,
+            original_number=self.original_number,
+            style=self.style,
+            offered_to=self.offered_to,
+            extra_instructions=self.extra_instructions,
+            repetitions=self.repetitions,
+            received_at=self.received_at,
+        )
+
+
 def merge_multipage_hymns(pages_data: list[PageData]) -> list[Hymn]:
     """
     Combine pages of continuation with the preceding hymn.
@@ -24,66 +113,59 @@ def merge_multipage_hymns(pages_data: list[PageData]) -> list[Hymn]:
         return []
 
     merged_hymns = []
-    current_hymn_data: Optional[dict] = None
+    current_hymn: Optional[_HymnAccumulator] = None
 
     for page in pages_data:
-        if page.page_type == PageType.COVER:
-            # Skip cover pages
-            continue
+        page_type = page.page_type
 
-        if page.page_type == PageType.BLANK:
-            # Skip blank pages
+        if page_type in _SKIP_TYPES:
+            # Skip cover and blank pages
             continue
 
-        if page.page_type == PageType.NEW_HYMN:
+        # Enum members are singletons, so identity checks are enough
+        if page_type is PageType.NEW_HYMN:
             # Save previous hymn if exists
-            if current_hymn_data:
+            if current_hymn:
                 try:
-                    hymn = Hymn(**current_hymn_data)
-                    merged_hymns.append(hymn)
+                    merged_hymns.append(current_hymn.to_hymn())
                 except Exception:
                     # Skip invalid hymns
                     pass
 
             # Start new hymn
-            current_hymn_data = {
-                "number": page.hymn_number or 0,
-                "title": page.hymn_title or "Untitled",
-                "text": page.body_text or "",
-                "original_number": page.original_number,
-                "style": page.style,
-                "offered_to": page.offered_to,
-                "extra_instructions": page.extra_instructions,
-                "repetitions": page.repetitions,
-                "received_at": page.received_at,
-            }
-
-        elif page.page_type == PageType.CONTINUATION and current_hymn_data:
+            current_hymn = _HymnAccumulator(
+                number=page.hymn_number or 0,
+                title=page.hymn_title or "Untitled",
+                parts=[page.body_text] if page.body_text else [],
+                original_number=page.original_number,
+                style=page.style,
+                offered_to=page.offered_to,
+                extra_instructions=page.extra_instructions,
+                repetitions=page.repetitions,
+                received_at=page.received_at,
+            )
+
+        elif page_type is PageType.CONTINUATION and current_hymn:
             # Append text to current hymn
             if page.body_text:
-                prev_text = current_hymn_data.get("text", "")
-                if prev_text:
-                    current_hymn_data["text"] = prev_text + "\n\n" + page.body_text
-                else:
-                    current_hymn_data["text"] = page.body_text
+                current_hymn.add_part(page.body_text)
 
             # Take date/repetitions from continuation if available
             if page.received_at:
-                current_hymn_data["received_at"] = page.received_at
+                current_hymn.received_at = page.received_at
 
             if page.repetitions:
                 # Adjust repetition line numbers
-                current_hymn_data["repetitions"] = adjust_repetition_numbers(
-                    current_hymn_data.get("repetitions"),
+                current_hymn.repetitions = adjust_repetition_numbers(
+                    current_hymn.repetitions,
                     page.repetitions,
-                    current_hymn_data.get("text", ""),
+                    prev_line_count=current_hymn.line_count,
                 )
 
     # Don't forget the last hymn
-    if current_hymn_data:
+    if current_hymn:
         try:
-            hymn = Hymn(**current_hymn_data)
-            merged_hymns.append(hymn)
+            merged_hymns.append(current_hymn.to_hymn())
         except Exception:
             pass
 
@@ -111,21 +193,23 @@ def create_page_data_from_ocr(
 
     This is a helper function to construct PageData objects.
     """
-    return PageData(
-        page_number=page_number,
-        page_type=page_type,
-        header_text=header_text,
-        metadata_text=metadata_text,
-        body_text=body_text,
-        footer_text=footer_text,
-        repetitions=repetitions,
-        hymn_number=hymn_number,
-        hymn_title=hymn_title,
-        original_number=original_number,
-        offered_to=offered_to,
-        style=style,
-        extra_instructions=extra_instructions,
-        received_at=received_at,
+    return PAGE_DATA_ADAPTER.validate_python(
+        {
+            "page_number": page_number,
+            "page_type": page_type,
+            "header_text": header_text,
+            "metadata_text": metadata_text,
+            "body_text": body_text,
+            "footer_text": footer_text,
+            "repetitions": repetitions,
+            "hymn_number": hymn_number,
+            "hymn_title": hymn_title,
+            "original_number": original_number,
+            "offered_to": offered_to,
+            "style": style,
+            "extra_instructions": extra_instructions,
+            "received_at": received_at,
+        }
     )
 
 
@@ -139,14 +223,8 @@ def count_hymns_by_type(pages_data: list[PageData]) -> dict[str, int]:
     Returns:
         Dictionary with counts by page type.
     """
-    counts = {
-        "cover": 0,
-        "new_hymn": 0,
-        "continuation": 0,
-        "blank": 0,
-    }
-
-    for page in pages_data:
-        counts[page.page_type.value] += 1
+    # Count the enum members themselves (singletons) and render values once
+    counts = Counter(page.page_type for page in pages_data)
 
-    return counts
+    # Report every page type, including those with no pages
+    return {page_type.value: counts[page_type] for page_type in PageType}
@@ -1,9 +1,14 @@
 """Pydantic models for hymn data structures."""
 
+import re
 from enum import Enum
 from typing import Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
+
+
+# Accepted format for Hymn.received_at (YYYY-MM-DD)
+ISO_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 
 class PageType(str, Enum):
@@ -48,9 +53,7 @@ class Hymn(BaseModel):
         """Validate date is in YYYY-MM-DD format."""
         if v is None:
             return None
-        import re
-
-        if not re.match(r"^\d{4}-\d{2}-\d{2}$", v):
+        if not ISO_DATE_PATTERN.match(v):
             raise ValueError("Date must be in YYYY-MM-DD format")
         return v
 
@@ -89,3 +92,7 @@ class PageData(BaseModel):
     style: Optional[str] = Field(None, description="Parsed style")
     extra_instructions: Optional[str] = Field(None, description="Parsed instructions")
     received_at: Optional[str] = Field(None, description="Parsed date")
+
+
+# Prebuilt validator for the hot PageData construction path (schema built once at import)
+PAGE_DATA_ADAPTER = TypeAdapter(PageData)
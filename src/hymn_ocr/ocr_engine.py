@@ -1,5 +1,10 @@
 """OCR engine using Tesseract for text extraction."""
 
+import hashlib
+import re
+import threading
+import weakref
+from collections import OrderedDict
 from typing import Optional
 
 import cv2
@@ -9,6 +14,12 @@ from PIL import Image
 
 from hymn_ocr.zone_detector import Zone, extract_zone, pil_to_cv2
 
+# Optional in-process Tesseract bindings (avoid a subprocess per OCR call)
+try:
+    import tesserocr
+except ImportError:  # pragma: no cover - depends on the environment
+    tesserocr = None
+
 
 # Tesseract configuration
 # PSM 6 = Assume a single uniform block of text
@@ -16,6 +27,133 @@ from hymn_ocr.zone_detector import Zone, extract_zone, pil_to_cv2
 TESSERACT_CONFIG = "--psm 6 --oem 3"
 TESSERACT_LANG = "por"  # Portuguese
 
+# OCR result caches: Tesseract calls dominate runtime and the same image
+# always produces the same text and line positions, so results are
+# memoized by image content
+OCR_CACHE_SIZE = 32
+_ocr_cache: OrderedDict[tuple, str] = OrderedDict()
+_line_positions_cache: OrderedDict[tuple, tuple] = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+
+# Config strings the tesserocr path can honour: only --psm and --oem 3 (default)
+_TESSEROCR_CONFIG_PATTERN = re.compile(r"^\s*(?:(?:--psm\s+(?P<psm>\d+)|--oem\s+3)\s*)*$")
+
+# clean_ocr_text patterns
+_LINE_ENDING_PATTERN = re.compile(r"\r\n?")
+# Whitespace (other than the newline itself) around each line break
+_LINE_WHITESPACE_PATTERN = re.compile(r"[^\S\n]*\n[^\S\n]*")
+_BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+
+# Per-thread scratch buffer for the intermediate grayscale image in preprocess_for_ocr
+_scratch_local = threading.local()
+
+# One tesserocr API per thread and language (the API is not thread-safe)
+_tess_local = threading.local()
+
+
+def _end_tess_apis(apis: dict) -> None:
+    """End and forget the given tesserocr APIs, releasing their Tesseract handles."""
+    for api in apis.values():
+        api.End()
+    apis.clear()
+
+
+def _get_tess_api(lang: str):
+    """Return this thread's tesserocr API for a language, creating it on first use."""
+    apis = getattr(_tess_local, "apis", None)
+    if apis is None:
+        apis = _tess_local.apis = {}
+        # End the thread's APIs once the thread object is gone (or at exit)
+        weakref.finalize(threading.current_thread(), _end_tess_apis, apis)
+    api = apis.get(lang)
+    if api is None:
+        api = apis[lang] = tesserocr.PyTessBaseAPI(lang=lang)
+    return api
+
+
+def close_tess_apis() -> None:
+    """
+    Release the tesserocr APIs created by the calling thread.
+
+    They are recreated on the next OCR call from this thread. APIs of other
+    threads are released when those threads are garbage collected.
+    """
+    apis = getattr(_tess_local, "apis", None)
+    if apis:
+        _end_tess_apis(apis)
+
+
+def _image_to_string(gray: np.ndarray, lang: str, config: str) -> str:
+    """
+    Run Tesseract on a grayscale image.
+
+    Uses tesserocr in-process when it is installed and the config only sets
+    the page segmentation mode; otherwise falls back to pytesseract.
+
+    Args:
+        gray: Grayscale image as numpy array.
+        lang: Tesseract language code.
+        config: Tesseract configuration string.
+
+    Returns:
+        Raw OCR text.
+    """
+    match = _TESSEROCR_CONFIG_PATTERN.match(config) if tesserocr is not None else None
+    if match is None:
+        return pytesseract.image_to_string(Image.fromarray(gray), lang=lang, config=config)
+
+    api = _get_tess_api(lang)
+    psm = match.group("psm")
+    api.SetPageSegMode(int(psm) if psm else tesserocr.PSM.AUTO)
+
+    # Pass raw pixels directly, no PIL/PNG round-trip (1 byte per pixel)
+    gray = np.ascontiguousarray(gray)
+    height, width = gray.shape
+    api.SetImageBytes(gray.tobytes(), width, height, 1, width)
+    return api.GetUTF8Text()
+
+
+def _image_key(image: np.ndarray) -> tuple:
+    """Build a cheap content key for an image (hash of bytes, shape, dtype)."""
+    data = np.ascontiguousarray(image)
+    digest = hashlib.blake2b(data, digest_size=16).digest()
+    return (digest, data.shape, data.dtype.str)
+
+
+def _cache_get(cache: OrderedDict, key: tuple):
+    """Return a cached value (marking it as recently used), or None."""
+    with _ocr_cache_lock:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+
+def _cache_put(cache: OrderedDict, key: tuple, value) -> None:
+    """Store a value, evicting the least recently used entries."""
+    with _ocr_cache_lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > OCR_CACHE_SIZE:
+            cache.popitem(last=False)
+
+
+def clear_ocr_cache() -> None:
+    """Discard all memoized OCR results."""
+    with _ocr_cache_lock:
+        _ocr_cache.clear()
+        _line_positions_cache.clear()
+
+
+def _gray_scratch(height: int, width: int) -> np.ndarray:
+    """Return a reusable (height, width) uint8 buffer for the calling thread."""
+    size = height * width
+    buffer = getattr(_scratch_local, "buffer", None)
+    if buffer is None or buffer.size < size:
+        buffer = _scratch_local.buffer = np.empty(size, dtype=np.uint8)
+    return buffer[:size].reshape(height, width)
+
 
 def preprocess_for_ocr(image: np.ndarray) -> np.ndarray:
     """
@@ -27,14 +165,15 @@ def preprocess_for_ocr(image: np.ndarray) -> np.ndarray:
     Returns:
         Preprocessed grayscale image.
     """
-    # Convert to grayscale
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    # Convert to grayscale (into a reused scratch buffer)
+    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=_gray_scratch(*image.shape[:2]))
 
-    # Apply slight Gaussian blur to reduce noise
-    gray = cv2.GaussianBlur(gray, (3, 3), 0)
+    # Apply slight Gaussian blur to reduce noise (in place)
+    cv2.GaussianBlur(gray, (3, 3), 0, dst=gray)
 
     # Apply adaptive thresholding for better text contrast
     # This helps with varying lighting conditions
+    # The result is a new array since it is returned to the caller
     binary = cv2.adaptiveThreshold(
         gray,
         255,
@@ -65,17 +204,21 @@ def ocr_image(
     Returns:
         Extracted text as string.
     """
+    key = (_image_key(image), lang, config, preprocess)
+    cached = _cache_get(_ocr_cache, key)
+    if cached is not None:
+        return cached
+
     if preprocess:
         processed = preprocess_for_ocr(image)
     else:
         processed = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
 
-    # Convert to PIL for pytesseract
-    pil_image = Image.fromarray(processed)
+    text = _image_to_string(processed, lang=lang, config=config).strip()
 
-    text = pytesseract.image_to_string(pil_image, lang=lang, config=config)
+    _cache_put(_ocr_cache, key, text)
 
-    return text.strip()
+    return text
 
 
 def ocr_zone(
@@ -147,6 +290,12 @@ def get_text_line_positions(
     if zone is not None:
         image = extract_zone(image, zone)
 
+    # Keyed on the cropped pixels, so full-image and zone calls share the cache
+    cache_key = _image_key(image)
+    cached = _cache_get(_line_positions_cache, cache_key)
+    if cached is not None:
+        return list(cached)
+
     # Preprocess
     processed = preprocess_for_ocr(image)
     pil_image = Image.fromarray(processed)
@@ -188,6 +337,8 @@ def get_text_line_positions(
         text = " ".join(line_data["words"])
         result.append((line_data["y_start"], line_data["y_end"], text))
 
+    _cache_put(_line_positions_cache, cache_key, tuple(result))
+
     return result
 
 
@@ -209,19 +360,13 @@ def clean_ocr_text(text: str) -> str:
         return ""
 
     # Normalize line endings
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-
-    # Remove multiple consecutive blank lines
-    while "\n\n\n" in text:
-        text = text.replace("\n\n\n", "\n\n")
+    text = _LINE_ENDING_PATTERN.sub("\n", text)
 
     # Remove leading/trailing whitespace on each line
-    lines = [line.strip() for line in text.split("\n")]
+    text = _LINE_WHITESPACE_PATTERN.sub("\n", text)
 
-    # Remove empty lines at start and end
-    while lines and not lines[0]:
-        lines.pop(0)
-    while lines and not lines[-1]:
-        lines.pop()
+    # Remove multiple consecutive blank lines
+    text = _BLANK_LINES_PATTERN.sub("\n\n", text)
 
-    return "\n".join(lines)
+    # Remove empty lines (and whitespace) at start and end
+    return text.strip()
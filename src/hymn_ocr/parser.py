@@ -28,6 +28,25 @@ INSTRUCTION_PATTERN = re.compile(
 # Page number at bottom (standalone number)
 PAGE_NUMBER_PATTERN = re.compile(r"^\s*(\d+)\s*$", re.MULTILINE)
 
+# clean_body_text line filters (matched against stripped lines)
+# Symbol artifacts: XX, WC, Xx, CC, x, X at end or as standalone
+SYMBOL_LINE_PATTERN = re.compile(r"^[XxWwCc]{1,2}\s*[xX]?\s*$")
+
+# Date pattern at end of text
+DATE_LINE_PATTERN = re.compile(r"^\s*\(\d{2}/\d{2}/\d{4}\)\s*$")
+
+# Instructions that should be in metadata
+INSTRUCTION_LINE_PATTERN = re.compile(r"^\s*([Ee]m pé|[Ss]em instrumentos|[Ss]entados?)\s*$")
+
+# OCR noise: random uppercase letters with parentheses (e.g., "(NOINAIININN")
+OCR_NOISE_PATTERN = re.compile(r"^[\(\)\[\]oO0lI1NnAa\s]+$")
+
+# Single character lines (usually OCR errors)
+SINGLE_CHAR_PATTERN = re.compile(r"^[a-zA-ZoO0\(\)\[\]]$")
+
+# Lines with only consonants or gibberish (no real Portuguese words)
+GIBBERISH_PATTERN = re.compile(r"^\(?[NIOAL1l0]{4,}\)?$")
+
 
 @dataclass
 class ParsedHeader:
@@ -281,22 +300,6 @@ def clean_body_text(text: str) -> str:
     # Split into lines
     lines = text.split("\n")
 
-    # Patterns to remove
-    # Symbol artifacts: XX, WC, Xx, CC, x, X at end or as standalone
-    symbol_pattern = re.compile(r"^[XxWwCc]{1,2}\s*[xX]?\s*$")
-    # Date pattern at end of text
-    date_pattern = re.compile(r"^\s*\(\d{2}/\d{2}/\d{4}\)\s*$")
-    # Instructions that should be in metadata
-    instruction_line_pattern = re.compile(
-        r"^\s*([Ee]m pé|[Ss]em instrumentos|[Ss]entados?)\s*$"
-    )
-    # OCR noise: random uppercase letters with parentheses (e.g., "(NOINAIININN")
-    ocr_noise_pattern = re.compile(r"^[\(\)\[\]oO0lI1NnAa\s]+$")
-    # Single character lines (usually OCR errors)
-    single_char_pattern = re.compile(r"^[a-zA-ZoO0\(\)\[\]]$")
-    # Lines with only consonants or gibberish (no real Portuguese words)
-    gibberish_pattern = re.compile(r"^\(?[NIOAL1l0]{4,}\)?$")
-
     cleaned_lines = []
     for line in lines:
         stripped = line.strip()
@@ -311,27 +314,27 @@ def clean_body_text(text: str) -> str:
             continue
 
         # Skip symbol artifacts
-        if symbol_pattern.match(stripped):
+        if SYMBOL_LINE_PATTERN.match(stripped):
             continue
 
         # Skip standalone dates
-        if date_pattern.match(stripped):
+        if DATE_LINE_PATTERN.match(stripped):
             continue
 
         # Skip standalone instruction lines
-        if instruction_line_pattern.match(stripped):
+        if INSTRUCTION_LINE_PATTERN.match(stripped):
             continue
 
         # Skip OCR noise (random chars like "(NOINAIININN")
-        if ocr_noise_pattern.match(stripped):
+        if OCR_NOISE_PATTERN.match(stripped):
             continue
 
         # Skip single character lines
-        if single_char_pattern.match(stripped):
+        if SINGLE_CHAR_PATTERN.match(stripped):
             continue
 
         # Skip gibberish lines
-        if gibberish_pattern.match(stripped):
+        if GIBBERISH_PATTERN.match(stripped):
             continue
 
         # Remove repetition bar markers (|) at the start of lines
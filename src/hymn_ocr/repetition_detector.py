@@ -1,5 +1,6 @@
 """Detection of repetition bars (vertical lines) in hymn images."""
 
+import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -18,6 +19,9 @@ HOUGH_MAX_LINE_GAP = 10
 LEFT_MARGIN_PERCENT = 0.15
 VERTICAL_TOLERANCE = 10  # Max horizontal deviation for a line to be considered vertical
 
+# Line range in a repetitions string, e.g. "1-4"
+REPETITION_RANGE_PATTERN = re.compile(r"(\d+)-(\d+)")
+
 
 @dataclass
 class VerticalSegment:
@@ -46,14 +50,14 @@ def detect_vertical_lines(
     Detect vertical lines in the left margin of an image.
 
     Args:
-        image: BGR image as numpy array.
+        image: BGR or single-channel grayscale image as numpy array.
         left_margin_percent: Percentage of image width to consider as left margin.
 
     Returns:
         List of VerticalSegment objects.
     """
-    # Convert to grayscale
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    # Convert to grayscale (already-gray input is used as is)
+    gray = image if image.ndim == 2 else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     height, width = gray.shape
 
     # Apply edge detection
@@ -176,7 +180,7 @@ def detect_repetition_bars(
     Detect repetition bars in an image and map them to line numbers.
 
     Args:
-        image: BGR image as numpy array.
+        image: BGR or single-channel grayscale image as numpy array.
         text_lines: Optional list of (y_start, y_end, text) tuples for mapping.
         zone: Optional zone to analyze. If provided, uses only this zone.
 
@@ -252,7 +256,8 @@ def visualize_repetition_bars(
 def adjust_repetition_numbers(
     prev_repetitions: Optional[str],
     new_repetitions: Optional[str],
-    combined_text: str,
+    combined_text: str = "",
+    prev_line_count: Optional[int] = None,
 ) -> Optional[str]:
     """
     Adjust repetition line numbers when merging multi-page hymns.
@@ -265,6 +270,8 @@ def adjust_repetition_numbers(
         prev_repetitions: Repetitions from previous page(s).
         new_repetitions: Repetitions from the new page.
         combined_text: Combined text from all pages.
+        prev_line_count: Line count of the combined text, if already known.
+            When given, combined_text is not scanned.
 
     Returns:
         Combined repetitions string with adjusted line numbers.
@@ -277,19 +284,18 @@ def adjust_repetition_numbers(
 
     # Count lines in previous text to determine offset
     # This is approximate - we count double newlines as stanza breaks
-    prev_lines_count = combined_text.count("\n") + 1
+    if prev_line_count is None:
+        prev_line_count = combined_text.count("\n") + 1
 
     # Parse new repetitions and offset them
-    import re
-
     adjusted_parts = []
 
     for part in new_repetitions.split(","):
         part = part.strip()
-        match = re.match(r"(\d+)-(\d+)", part)
+        match = REPETITION_RANGE_PATTERN.match(part)
         if match:
-            start = int(match.group(1)) + prev_lines_count
-            end = int(match.group(2)) + prev_lines_count
+            start = int(match.group(1)) + prev_line_count
+            end = int(match.group(2)) + prev_line_count
             adjusted_parts.append(f"{start}-{end}")
         else:
             # Keep as-is if can't parse
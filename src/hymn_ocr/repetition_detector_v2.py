@@ -31,6 +31,24 @@ NUM_COLUMNS = 3  # Number of columns to divide the bar region into
 GAP_DETECTION_THRESHOLD = 0.5  # Relative threshold for detecting gaps within segments
 MIN_GAP_HEIGHT_PERCENT = 0.015  # Minimum gap height (1.5% of body height)
 
+# Common instruction patterns that appear in PDFs but are not hymn text
+# These are extra_instructions like "Em pé", "sem instrumentos", etc.
+INSTRUCTION_PATTERNS = [
+    'sem instrumentos',
+    'em pé',
+    'sentados',
+    'sentado',
+    'de pé',
+    'em pe',  # without accent
+    'instrumental',
+]
+# Pre-encoded once so line filtering can use bytes.__contains__
+_INSTRUCTION_PATTERN_BYTES = tuple(p.encode('utf-8') for p in INSTRUCTION_PATTERNS)
+
+# Returned when no text lines are found; read-only since it is shared
+_EMPTY_LINE_BOUNDARIES = np.empty((0, 2), dtype=np.int32)
+_EMPTY_LINE_BOUNDARIES.setflags(write=False)
+
 
 @dataclass
 class BarSegment:
@@ -267,13 +285,13 @@ def detect_repetition_bars_v2(
         if segment_percent >= 0.15:
             # Filter line_boundaries to only include lines within/near the segment
             # This prevents noise detection on lines far from the actual bars
-            segment_line_boundaries = []
-            for i, (y_min, y_max) in enumerate(line_boundaries):
-                line_center = (y_min + y_max) / 2
-                # Line overlaps with segment if center is within segment bounds (with margin)
-                margin = (y_max - y_min) / 2  # Half line height as margin
-                if segment.y_start - margin <= line_center <= segment.y_end + margin:
-                    segment_line_boundaries.append((y_min, y_max))
+            line_centers = (line_boundaries[:, 0] + line_boundaries[:, 1]) / 2
+            # Line overlaps with segment if center is within segment bounds (with margin)
+            margins = (line_boundaries[:, 1] - line_boundaries[:, 0]) / 2  # Half line height
+            in_segment = (segment.y_start - margins <= line_centers) & (
+                line_centers <= segment.y_end + margins
+            )
+            segment_line_boundaries = line_boundaries[in_segment]
 
             # Need at least 3 lines within segment for asymmetric detection
             if len(segment_line_boundaries) >= 3:
@@ -448,16 +466,20 @@ def detect_repetition_bars_v2(
     use_tesseract = len(line_boundaries) >= 2  # Need at least 2 lines for meaningful mapping
     tesseract_num_lines = len(line_boundaries) if use_tesseract else num_lines
 
+    if use_tesseract:
+        # Use precise Tesseract positions, mapping all segment ends in one pass
+        start_lines = map_ys_to_lines_tesseract(
+            [s.y_start for s in sorted_segments], line_boundaries, is_end=False
+        )
+        end_lines = map_ys_to_lines_tesseract(
+            [s.y_end for s in sorted_segments], line_boundaries, is_end=True
+        )
+
     repetitions = []
-    for segment in sorted_segments:
+    for k, segment in enumerate(sorted_segments):
         if use_tesseract:
-            # Use precise Tesseract positions
-            start_line = map_y_to_line_tesseract(
-                segment.y_start, line_boundaries, is_end=False
-            )
-            end_line = map_y_to_line_tesseract(
-                segment.y_end, line_boundaries, is_end=True
-            )
+            start_line = int(start_lines[k])
+            end_line = int(end_lines[k])
             effective_num_lines = tesseract_num_lines
         else:
             # Fallback to estimated line height
@@ -607,7 +629,7 @@ def count_peaks_in_profile(
 
 def count_bars_per_line(
     bar_region: np.ndarray,
-    line_boundaries: list[tuple[int, int]],
+    line_boundaries: np.ndarray,
     slice_margin: int = 5,
 ) -> list[int]:
     """
@@ -621,7 +643,7 @@ def count_bars_per_line(
 
     Args:
         bar_region: BGR image of the left margin (bar) region.
-        line_boundaries: List of (y_min, y_max) for each text line.
+        line_boundaries: (N, 2) array of (y_min, y_max) for each text line.
         slice_margin: Pixels above/below line center to include in slice.
 
     Returns:
@@ -631,7 +653,7 @@ def count_bars_per_line(
     if bar_region is None or bar_region.size == 0:
         return []
 
-    if not line_boundaries:
+    if len(line_boundaries) == 0:
         return []
 
     bar_counts = []
@@ -775,7 +797,7 @@ def find_bar_segments(
 
 def get_line_boundaries_tesseract(
     body_image: np.ndarray,
-) -> list[tuple[int, int]]:
+) -> np.ndarray:
     """
     Get the Y boundaries of each text line using Tesseract OCR.
 
@@ -786,11 +808,11 @@ def get_line_boundaries_tesseract(
         body_image: BGR image of the body zone.
 
     Returns:
-        List of (y_min, y_max) tuples for each line, sorted by y_min.
-        Empty list if OCR fails or no text detected.
+        (N, 2) int32 array of (y_min, y_max) rows for each line, sorted by y_min.
+        Empty (0, 2) array if OCR fails or no text detected.
     """
     if body_image is None or body_image.size == 0:
-        return []
+        return _EMPTY_LINE_BOUNDARIES
 
     # Convert to RGB for Tesseract (expects RGB, not BGR)
     if len(body_image.shape) == 3:
@@ -806,10 +828,10 @@ def get_line_boundaries_tesseract(
             lang='por',  # Portuguese
         )
     except Exception:
-        return []
+        return _EMPTY_LINE_BOUNDARIES
 
     # Group words by line (using block_num, par_num, line_num as key)
-    lines: dict[tuple[int, int, int], dict[str, int]] = {}
+    lines: dict[tuple[int, int, int], dict] = {}
 
     for i, text in enumerate(data['text']):
         # Skip empty or whitespace-only entries
@@ -839,44 +861,27 @@ def get_line_boundaries_tesseract(
         h = data['height'][i]
 
         if line_key not in lines:
-            lines[line_key] = {'y_min': y, 'y_max': y + h, 'text': text_stripped}
+            lines[line_key] = {'y_min': y, 'y_max': y + h, 'text_parts': [text_stripped]}
         else:
             lines[line_key]['y_min'] = min(lines[line_key]['y_min'], y)
             lines[line_key]['y_max'] = max(lines[line_key]['y_max'], y + h)
-            lines[line_key]['text'] += ' ' + text_stripped
+            lines[line_key]['text_parts'].append(text_stripped)
 
     if not lines:
-        return []
-
-    # Common instruction patterns that appear in PDFs but are not hymn text
-    # These are extra_instructions like "Em pé", "sem instrumentos", etc.
-    INSTRUCTION_PATTERNS = [
-        'sem instrumentos',
-        'em pé',
-        'sentados',
-        'sentado',
-        'de pé',
-        'em pe',  # without accent
-        'instrumental',
-    ]
+        return _EMPTY_LINE_BOUNDARIES
 
     # Filter out lines that are likely artifacts or instructions
     filtered_lines = []
     for line_data in lines.values():
-        text = line_data.get('text', '')
-        text_lower = text.lower().strip()
+        text = ' '.join(line_data['text_parts'])
 
         # Real hymn lines usually have more than 2-3 characters
         if len(text) <= 3:
             continue
 
-        # Skip instruction patterns
-        is_instruction = False
-        for pattern in INSTRUCTION_PATTERNS:
-            if pattern in text_lower:
-                is_instruction = True
-                break
-        if is_instruction:
+        # Skip instruction patterns (byte-level search on the encoded line)
+        text_bytes = text.lower().strip().encode('utf-8', 'ignore')
+        if any(pattern in text_bytes for pattern in _INSTRUCTION_PATTERN_BYTES):
             continue
 
         filtered_lines.append((line_data['y_min'], line_data['y_max']))
@@ -884,12 +889,12 @@ def get_line_boundaries_tesseract(
     # Sort by y_min (top to bottom)
     sorted_lines = sorted(filtered_lines, key=lambda x: x[0])
 
-    return sorted_lines
+    return np.asarray(sorted_lines, dtype=np.int32).reshape(-1, 2)
 
 
 def map_y_to_line_tesseract(
     y: int,
-    line_boundaries: list[tuple[int, int]],
+    line_boundaries: np.ndarray,
     is_end: bool = False,
 ) -> int:
     """
@@ -900,42 +905,61 @@ def map_y_to_line_tesseract(
 
     Args:
         y: Y coordinate in the body zone.
-        line_boundaries: List of (y_min, y_max) tuples from get_line_boundaries_tesseract.
+        line_boundaries: (N, 2) array of (y_min, y_max) from get_line_boundaries_tesseract.
         is_end: If True, this is the end of a bar (adjust mapping accordingly).
 
     Returns:
         1-indexed line number.
     """
-    if not line_boundaries:
-        return 1
+    return int(map_ys_to_lines_tesseract([y], line_boundaries, is_end=is_end)[0])
+
 
+def map_ys_to_lines_tesseract(
+    ys: list[int] | np.ndarray,
+    line_boundaries: np.ndarray,
+    is_end: bool = False,
+) -> np.ndarray:
+    """
+    Map several Y coordinates to line numbers using actual Tesseract positions.
+
+    Vectorized form of map_y_to_line_tesseract: instead of scanning the lines
+    for each Y, the first line whose bottom reaches Y is found with a binary
+    search over the running maximum of the line bottoms.
+
+    Args:
+        ys: Y coordinates in the body zone.
+        line_boundaries: (N, 2) array of (y_min, y_max) from get_line_boundaries_tesseract.
+        is_end: If True, these are bar ends (adjust mapping accordingly).
+
+    Returns:
+        Array of 1-indexed line numbers, one per Y coordinate.
+    """
+    ys = np.asarray(ys)
     num_lines = len(line_boundaries)
 
-    # For each line, find where y falls
-    for i, (y_min, y_max) in enumerate(line_boundaries):
-        line_num = i + 1  # 1-indexed
-
-        if is_end:
-            # For bar end: include the line if bar ends at or after line center
-            line_center = (y_min + y_max) / 2
-            if y <= line_center:
-                # Bar ends before this line's center - doesn't cover this line
-                return max(1, line_num - 1) if line_num > 1 else 1
-            elif y <= y_max:
-                # Bar ends within this line - include it
-                return line_num
-        else:
-            # For bar start: include the line if bar starts before line's center
-            line_center = (y_min + y_max) / 2
-            if y <= line_center:
-                # Bar starts at or before this line's center - include this line
-                return line_num
-            elif y <= y_max:
-                # Bar starts in the second half of this line - still include it
-                return line_num
-
-    # If we get here, y is after all lines
-    return num_lines
+    if num_lines == 0:
+        return np.ones(ys.shape, dtype=np.intp)
+
+    y_min = line_boundaries[:, 0]
+    y_max = line_boundaries[:, 1]
+
+    # First line (in order) with y <= y_max; the running max keeps the
+    # search array sorted without changing which line is found first
+    idx = np.searchsorted(np.maximum.accumulate(y_max), ys, side="left")
+    found = idx < num_lines
+
+    # Bar start: include the line Y falls in (or the next one below it)
+    # If Y is after all lines, map to the last line
+    lines = np.where(found, idx + 1, num_lines)
+
+    if is_end:
+        # Bar end: only include the line if the bar reaches its center,
+        # otherwise stop at the previous line
+        centers = (y_min + y_max) / 2
+        before_center = found & (ys <= centers[np.minimum(idx, num_lines - 1)])
+        lines = np.where(before_center, np.maximum(1, idx), lines)
+
+    return lines
 
 
 def map_y_to_line_v3(
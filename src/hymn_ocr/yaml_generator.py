@@ -1,98 +1,147 @@
 """YAML generation for hymn book output."""
 
 from pathlib import Path
-from typing import Optional, Union
+from typing import IO, Optional, Union
 
 import yaml
 
 from hymn_ocr.models import Hymn, HymnBook
 
 
-class LiteralStr(str):
-    """String that should be rendered as a literal block in YAML."""
+# Use the libyaml-backed safe loader when available. Output stays on the
+# pure-Python SafeDumper: libyaml's emitter escapes non-BMP characters such as
+# emoji, which turns literal text blocks into double-quoted scalars.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-    pass
 
-
-def literal_str_representer(dumper: yaml.Dumper, data: LiteralStr) -> yaml.Node:
-    """Custom representer for literal block strings."""
-    return dumper.represent_scalar("tag:yaml.org,2002:str", data, style="|")
-
-
-# Register the custom representer
-yaml.add_representer(LiteralStr, literal_str_representer)
-
-
-def hymn_to_dict(hymn: Hymn) -> dict:
+def _hymn_items(hymn: Hymn) -> list[tuple[str, object]]:
     """
-    Convert a Hymn to a dictionary for YAML serialization.
+    Collect the (key, value) pairs written out for a Hymn, in output order.
 
     Args:
         hymn: Hymn object.
 
     Returns:
-        Dictionary representation.
+        List of key/value pairs, omitting unset optional fields.
     """
-    result = {
-        "number": hymn.number,
-        "title": hymn.title,
-        "text": LiteralStr(hymn.text) if "\n" in hymn.text else hymn.text,
-    }
+    items: list[tuple[str, object]] = [
+        ("number", hymn.number),
+        ("title", hymn.title),
+        ("text", hymn.text),
+    ]
 
     # Add optional fields only if they have values
     if hymn.original_number is not None:
-        result["original_number"] = hymn.original_number
+        items.append(("original_number", hymn.original_number))
     if hymn.style:
-        result["style"] = hymn.style
+        items.append(("style", hymn.style))
     if hymn.offered_to:
-        result["offered_to"] = hymn.offered_to
+        items.append(("offered_to", hymn.offered_to))
     if hymn.extra_instructions:
-        result["extra_instructions"] = hymn.extra_instructions
+        items.append(("extra_instructions", hymn.extra_instructions))
     if hymn.repetitions:
-        result["repetitions"] = hymn.repetitions
+        items.append(("repetitions", hymn.repetitions))
     if hymn.received_at:
-        result["received_at"] = hymn.received_at
+        items.append(("received_at", hymn.received_at))
 
-    return result
+    return items
 
 
-def hymnbook_to_dict(hymnbook: HymnBook) -> dict:
+def _hymnbook_items(hymnbook: HymnBook) -> list[tuple[str, object]]:
     """
-    Convert a HymnBook to a dictionary for YAML serialization.
+    Collect the (key, value) pairs written out for a HymnBook, in output order.
 
     Args:
         hymnbook: HymnBook object.
 
     Returns:
-        Dictionary representation.
+        List of key/value pairs; the hymns are left as Hymn objects.
     """
-    result = {
-        "name": hymnbook.name,
-        "owner_name": hymnbook.owner_name,
-    }
+    items: list[tuple[str, object]] = [
+        ("name", hymnbook.name),
+        ("owner_name", hymnbook.owner_name),
+    ]
 
     if hymnbook.intro_name:
-        result["intro_name"] = hymnbook.intro_name
+        items.append(("intro_name", hymnbook.intro_name))
+
+    items.append(("hymns", hymnbook.hymns))
+
+    return items
+
+
+def hymn_representer(dumper: yaml.Dumper, data: Hymn) -> yaml.Node:
+    """Represent a Hymn as a mapping, writing multiline text as a literal block."""
+    pairs = []
+    for key, value in _hymn_items(data):
+        if key == "text" and "\n" in value:
+            value_node = dumper.represent_scalar("tag:yaml.org,2002:str", value, style="|")
+        else:
+            value_node = dumper.represent_data(value)
+        pairs.append((dumper.represent_data(key), value_node))
+
+    return yaml.MappingNode("tag:yaml.org,2002:map", pairs, flow_style=dumper.default_flow_style)
+
+
+def hymnbook_representer(dumper: yaml.Dumper, data: HymnBook) -> yaml.Node:
+    """Represent a HymnBook as a mapping without building an intermediate dict."""
+    return dumper.represent_mapping("tag:yaml.org,2002:map", _hymnbook_items(data))
+
+
+class HymnDumper(yaml.SafeDumper):
+    """Safe YAML dumper with the hymn book representers preinstalled."""
+
+
+# Register on our own subclass so the shared PyYAML dumpers stay untouched
+HymnDumper.add_representer(Hymn, hymn_representer)
+HymnDumper.add_representer(HymnBook, hymnbook_representer)
+
+
+def hymn_to_dict(hymn: Hymn) -> dict:
+    """
+    Convert a Hymn to a dictionary for YAML serialization.
+
+    Args:
+        hymn: Hymn object.
+
+    Returns:
+        Dictionary representation.
+    """
+    return dict(_hymn_items(hymn))
+
 
+def hymnbook_to_dict(hymnbook: HymnBook) -> dict:
+    """
+    Convert a HymnBook to a dictionary for YAML serialization.
+
+    Args:
+        hymnbook: HymnBook object.
+
+    Returns:
+        Dictionary representation.
+    """
+    result = dict(_hymnbook_items(hymnbook))
     result["hymns"] = [hymn_to_dict(h) for h in hymnbook.hymns]
 
     return result
 
 
-def generate_yaml(hymnbook: HymnBook) -> str:
+def _dump_hymnbook(hymnbook: HymnBook, stream: Optional[IO[str]] = None) -> Optional[str]:
     """
-    Generate YAML string from a HymnBook.
+    Serialize a HymnBook with the module's YAML options.
 
     Args:
         hymnbook: HymnBook object to serialize.
+        stream: Text stream to write to. If None, the YAML is returned.
 
     Returns:
-        YAML string.
+        YAML string when no stream is given, otherwise None.
     """
-    data = hymnbook_to_dict(hymnbook)
-
+    # The registered representers walk the models directly
     return yaml.dump(
-        data,
+        hymnbook,
+        stream,
+        Dumper=HymnDumper,
         default_flow_style=False,
         allow_unicode=True,
         sort_keys=False,
@@ -100,6 +149,19 @@ def generate_yaml(hymnbook: HymnBook) -> str:
     )
 
 
+def generate_yaml(hymnbook: HymnBook) -> str:
+    """
+    Generate YAML string from a HymnBook.
+
+    Args:
+        hymnbook: HymnBook object to serialize.
+
+    Returns:
+        YAML string.
+    """
+    return _dump_hymnbook(hymnbook)
+
+
 def save_yaml(hymnbook: HymnBook, output_path: Union[str, Path]) -> Path:
     """
     Save a HymnBook to a YAML file.
@@ -113,9 +175,9 @@ def save_yaml(hymnbook: HymnBook, output_path: Union[str, Path]) -> Path:
     """
     output_path = Path(output_path)
 
-    yaml_content = generate_yaml(hymnbook)
-
-    output_path.write_text(yaml_content, encoding="utf-8")
+    # Stream straight into the file instead of building the whole string first
+    with output_path.open("w", encoding="utf-8") as f:
+        _dump_hymnbook(hymnbook, f)
 
     return output_path
 
@@ -132,8 +194,9 @@ def load_yaml(input_path: Union[str, Path]) -> HymnBook:
     """
     input_path = Path(input_path)
 
-    content = input_path.read_text(encoding="utf-8")
-    data = yaml.safe_load(content)
+    # Let libyaml read and decode the bytes itself
+    with input_path.open("rb") as f:
+        data = yaml.load(f, Loader=_SafeLoader)
 
     hymns = [Hymn(**h) for h in data.get("hymns", [])]
 
@@ -155,15 +218,17 @@ def preview_yaml(hymnbook: HymnBook, max_hymns: int = 3) -> str:
 
     Returns:
         Preview YAML string.
+
+    Raises:
+        ValueError: If the preview would contain no hymns (e.g. max_hymns=0).
     """
-    # Create a copy with limited hymns
     preview_hymns = hymnbook.hymns[:max_hymns]
-    preview_book = HymnBook(
-        name=hymnbook.name,
-        owner_name=hymnbook.owner_name,
-        intro_name=hymnbook.intro_name,
-        hymns=preview_hymns,
-    )
+    # model_copy skips validation, so enforce HymnBook's at-least-one-hymn rule here
+    if not preview_hymns:
+        raise ValueError(f"max_hymns must select at least one hymn, got {max_hymns}")
+
+    # Shallow copy with limited hymns (no re-validation, no work for the rest)
+    preview_book = hymnbook.model_copy(update={"hymns": preview_hymns})
 
     yaml_str = generate_yaml(preview_book)
 
@@ -1,5 +1,6 @@
 """Zone detection using OpenCV for identifying page regions."""
 
+import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -46,14 +47,17 @@ FOOTER_START_PERCENT = 0.80
 HEADER_END_PERCENT = 0.18  # Header line should be in top 18% of page
 METADATA_HEIGHT = 80  # pixels after header line
 
+# Header pattern at the start of OCR text (NN. Title)
+HEADER_START_PATTERN = re.compile(r"^\s*(\d+)\.\s+")
+
 
 def pil_to_cv2(image: Image.Image) -> np.ndarray:
     """Convert PIL Image to OpenCV format (BGR)."""
-    # Convert to RGB first (PIL might be RGBA or other)
-    rgb = image.convert("RGB")
-    # Convert to numpy array
-    arr = np.array(rgb)
-    # Convert RGB to BGR (OpenCV format)
+    # Convert to RGB only when needed (PIL might be RGBA or other)
+    rgb = image if image.mode == "RGB" else image.convert("RGB")
+    # View as numpy array (no extra copy)
+    arr = np.asarray(rgb)
+    # Convert RGB to BGR (OpenCV format) in a single SIMD pass
     return cv2.cvtColor(arr, cv2.COLOR_RGB2BGR)
 
 
@@ -238,8 +242,6 @@ def classify_page(image: np.ndarray, ocr_text: Optional[str] = None) -> PageType
     Returns:
         PageType enum value.
     """
-    import re
-
     # Check if it's a cover page
     if is_cover_page(image):
         return PageType.COVER
@@ -247,7 +249,7 @@ def classify_page(image: np.ndarray, ocr_text: Optional[str] = None) -> PageType
     # If we have OCR text, use it for classification
     if ocr_text:
         # Look for header pattern at the start (NN. Title)
-        header_match = re.match(r"^\s*(\d+)\.\s+", ocr_text)
+        header_match = HEADER_START_PATTERN.match(ocr_text)
         if header_match:
             return PageType.NEW_HYMN
 
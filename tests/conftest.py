@@ -1,10 +1,21 @@
 """Shared test fixtures."""
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Optional
 
+import numpy as np
+import pytesseract
 import pytest
+from pdf2image.exceptions import PDFInfoNotInstalledError
 from PIL import Image
 
+from hymn_ocr import ocr_engine
+from hymn_ocr.models import HymnBook
+from hymn_ocr.ocr_engine import TESSERACT_LANG, clear_ocr_cache, ocr_image
+from hymn_ocr.pdf_processor import convert_pdf_to_images, get_page_count
+from hymn_ocr.zone_detector import PageZones, detect_zones, pil_to_cv2
+
 # Base paths
 TESTS_DIR = Path(__file__).parent
 FIXTURES_DIR = TESTS_DIR / "fixtures"
@@ -25,6 +36,89 @@ SAMPLE_YAML_PATH = (
     / "selecao_aniversario_ingrid.yaml"
 )
 
+# Deterministic text returned by the mocked Tesseract in unit tests; padded
+# like real Tesseract output so callers' stripping is exercised
+MOCK_OCR_TEXT = "  mocked text \n"
+
+# Valid model data; fixtures hand out fresh copies
+VALID_HYMN_DATA = {
+    "number": 1,
+    "title": "Disciplina",
+    "text": "Santa Maria\nO caminho da disciplina\nVem chegando noite e dia",
+    "original_number": 62,
+    "style": "Valsa",
+    "offered_to": "João",
+    "extra_instructions": "Em pé",
+    "repetitions": "1-4",
+    "received_at": "2020-01-18",
+}
+
+VALID_HYMNBOOK_DATA = {
+    "name": "Seleção Aniversário Ingrid",
+    "owner_name": "Ingrid",
+    "intro_name": "Introdução",
+    "hymns": [VALID_HYMN_DATA],
+}
+
+
+@pytest.fixture(autouse=True)
+def _mock_tesseract(monkeypatch: pytest.MonkeyPatch, request: pytest.FixtureRequest):
+    """Replace Tesseract with a deterministic stub unless the test is an integration test."""
+    if "integration" in request.keywords:
+        # Real OCR: reuse the session-wide Tesseract API when available
+        request.getfixturevalue("tess_api")
+        yield
+        return
+
+    def fake_image_to_string(gray: np.ndarray, lang: str, config: str) -> str:
+        # A blank (all-white) image yields no text, like the real engine
+        return "" if gray.min() == 255 else MOCK_OCR_TEXT
+
+    def fake_image_to_data(image, lang=None, config=None, output_type=None) -> dict:
+        return {"text": [], "line_num": [], "block_num": [], "top": [], "height": []}
+
+    clear_ocr_cache()
+    monkeypatch.setattr("hymn_ocr.ocr_engine._image_to_string", fake_image_to_string)
+    monkeypatch.setattr("pytesseract.image_to_data", fake_image_to_data)
+    yield
+    clear_ocr_cache()
+
+
+@pytest.fixture(scope="session")
+def tesseract_available() -> bool:
+    """Whether the Tesseract binary can be invoked (probed once per session)."""
+    try:
+        pytesseract.get_tesseract_version()
+    except Exception:
+        return False
+    return True
+
+
+@pytest.fixture(scope="session")
+def tess_api(tesseract_available: bool):
+    """
+    Session-wide tesserocr API, loaded once per worker and used by ocr_engine.
+
+    Yields None when tesserocr is not installed (ocr_engine then falls back
+    to pytesseract).
+    """
+    if ocr_engine.tesserocr is None or not tesseract_available:
+        yield None
+        return
+
+    api = ocr_engine.tesserocr.PyTessBaseAPI(lang=TESSERACT_LANG)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(ocr_engine._tess_local, "apis", {TESSERACT_LANG: api}, raising=False)
+        yield api
+    api.End()
+
+
+@pytest.fixture
+def requires_tesseract(tesseract_available: bool) -> None:
+    """Skip the test when Tesseract is not installed."""
+    if not tesseract_available:
+        pytest.skip("Tesseract is not installed")
+
 
 @pytest.fixture
 def fixtures_dir() -> Path:
@@ -32,13 +126,13 @@ def fixtures_dir() -> Path:
     return FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def images_dir() -> Path:
     """Path to test images directory."""
     return IMAGES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_pdf_path() -> Path:
     """Path to sample PDF file."""
     if not SAMPLE_PDF_PATH.exists():
@@ -46,6 +140,47 @@ def sample_pdf_path() -> Path:
     return SAMPLE_PDF_PATH
 
 
+@pytest.fixture(scope="session")
+def tiny_pdf_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """
+    One-page PDF generated once per session, for tests that need any valid PDF.
+
+    Much cheaper for Poppler to open and render than the 50-page sample.
+    """
+    path = tmp_path_factory.mktemp("pdf") / "tiny.pdf"
+    Image.new("RGB", (200, 300), "white").save(path, "PDF", resolution=72)
+    try:
+        get_page_count(path)
+    except PDFInfoNotInstalledError:
+        pytest.skip("Poppler is not installed")
+    return path
+
+
+@pytest.fixture(scope="session")
+def cached_convert() -> Callable[..., list[Image.Image]]:
+    """
+    Memoized convert_pdf_to_images, so each page range is rasterized once per session.
+
+    Callers share the returned images and must not modify them.
+    """
+    renders: dict[tuple, list[Image.Image]] = {}
+
+    def convert(
+        pdf_path: str | Path,
+        dpi: int = 300,
+        first_page: Optional[int] = None,
+        last_page: Optional[int] = None,
+    ) -> list[Image.Image]:
+        key = (str(pdf_path), dpi, first_page, last_page)
+        if key not in renders:
+            renders[key] = convert_pdf_to_images(
+                pdf_path, dpi=dpi, first_page=first_page, last_page=last_page
+            )
+        return renders[key]
+
+    return convert
+
+
 @pytest.fixture
 def sample_yaml_path() -> Path:
     """Path to sample YAML file."""
@@ -54,24 +189,54 @@ def sample_yaml_path() -> Path:
     return SAMPLE_YAML_PATH
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def cover_image(images_dir: Path) -> Image.Image:
-    """Load cover page image (page 1)."""
+    """Load cover page image (page 1), shared across the session."""
     path = images_dir / "page_01.png"
     if not path.exists():
         pytest.skip(f"Cover image not found: {path}")
     return Image.open(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def cover_cv2(cover_image: Image.Image) -> np.ndarray:
+    """Cover page converted to OpenCV (BGR) format once per session (read-only)."""
+    image = pil_to_cv2(cover_image)
+    image.setflags(write=False)
+    return image
+
+
+@pytest.fixture(scope="session")
 def first_hymn_image(images_dir: Path) -> Image.Image:
-    """Load first hymn page image (page 2)."""
+    """Load first hymn page image (page 2), shared across the session."""
     path = images_dir / "page_02.png"
     if not path.exists():
         pytest.skip(f"First hymn image not found: {path}")
     return Image.open(path)
 
 
+@pytest.fixture(scope="session")
+def first_hymn_cv2(first_hymn_image: Image.Image) -> np.ndarray:
+    """First hymn page converted to OpenCV (BGR) format once per session (read-only)."""
+    image = pil_to_cv2(first_hymn_image)
+    image.setflags(write=False)
+    return image
+
+
+@pytest.fixture(scope="session")
+def first_hymn_zones(first_hymn_cv2: np.ndarray) -> PageZones:
+    """Zones detected on the first hymn page once per session."""
+    return detect_zones(first_hymn_cv2)
+
+
+@pytest.fixture(scope="session")
+def ocr_full_first_hymn(tesseract_available: bool, first_hymn_cv2: np.ndarray) -> str:
+    """Full-page OCR text of the first hymn page, run once per session."""
+    if not tesseract_available:
+        pytest.skip("Tesseract is not installed")
+    return ocr_image(first_hymn_cv2)
+
+
 @pytest.fixture
 def second_hymn_image(images_dir: Path) -> Image.Image:
     """Load second hymn page image (page 3)."""
@@ -90,15 +255,23 @@ def multipage_start_image(images_dir: Path) -> Image.Image:
     return Image.open(path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def continuation_image(images_dir: Path) -> Image.Image:
-    """Load continuation page image (page 17)."""
+    """Load continuation page image (page 17), shared across the session."""
     path = images_dir / "page_17.png"
     if not path.exists():
         pytest.skip(f"Continuation image not found: {path}")
     return Image.open(path)
 
 
+@pytest.fixture(scope="session")
+def continuation_cv2(continuation_image: Image.Image) -> np.ndarray:
+    """Continuation page converted to OpenCV (BGR) format once per session (read-only)."""
+    image = pil_to_cv2(continuation_image)
+    image.setflags(write=False)
+    return image
+
+
 @pytest.fixture
 def last_hymn_image(images_dir: Path) -> Image.Image:
     """Load last hymn page image (page 50)."""
@@ -111,17 +284,7 @@ def last_hymn_image(images_dir: Path) -> Image.Image:
 @pytest.fixture
 def valid_hymn_data() -> dict:
     """Valid hymn data for testing."""
-    return {
-        "number": 1,
-        "title": "Disciplina",
-        "text": "Santa Maria\nO caminho da disciplina\nVem chegando noite e dia",
-        "original_number": 62,
-        "style": "Valsa",
-        "offered_to": "João",
-        "extra_instructions": "Em pé",
-        "repetitions": "1-4",
-        "received_at": "2020-01-18",
-    }
+    return dict(VALID_HYMN_DATA)
 
 
 @pytest.fixture
@@ -137,9 +300,10 @@ def minimal_hymn_data() -> dict:
 @pytest.fixture
 def valid_hymnbook_data(valid_hymn_data: dict) -> dict:
     """Valid hymn book data for testing."""
-    return {
-        "name": "Seleção Aniversário Ingrid",
-        "owner_name": "Ingrid",
-        "intro_name": "Introdução",
-        "hymns": [valid_hymn_data],
-    }
+    return {**VALID_HYMNBOOK_DATA, "hymns": [valid_hymn_data]}
+
+
+@pytest.fixture(scope="session")
+def valid_hymnbook() -> HymnBook:
+    """Validated HymnBook built once from the valid data (do not modify)."""
+    return HymnBook(**VALID_HYMNBOOK_DATA)
@@ -1,8 +1,10 @@
 """Tests for merger module."""
 
 import pytest
+from pydantic import ValidationError
 
 from hymn_ocr.merger import (
+    _HymnAccumulator,
     count_hymns_by_type,
     create_page_data_from_ocr,
     merge_multipage_hymns,
@@ -10,177 +12,157 @@ from hymn_ocr.merger import (
 from hymn_ocr.models import Hymn, PageData, PageType
 
 
-class TestMergeMultipageHymns:
-    """Tests for merge_multipage_hymns function."""
-
-    def test_merge_single_page(self):
-        """Test merging a single-page hymn."""
-        pages = [
-            PageData(
-                page_number=2,
-                page_type=PageType.NEW_HYMN,
-                body_text="Lyrics here",
-                hymn_number=1,
-                hymn_title="Test Hymn",
-            )
-        ]
-
-        hymns = merge_multipage_hymns(pages)
-
-        assert len(hymns) == 1
-        assert hymns[0].number == 1
-        assert hymns[0].title == "Test Hymn"
-        assert hymns[0].text == "Lyrics here"
-
-    def test_merge_two_pages(self):
-        """Test merging a two-page hymn."""
-        pages = [
-            PageData(
-                page_number=2,
-                page_type=PageType.NEW_HYMN,
-                body_text="First part",
-                hymn_number=1,
-                hymn_title="Test Hymn",
-            ),
-            PageData(
-                page_number=3,
-                page_type=PageType.CONTINUATION,
-                body_text="Second part",
-            ),
-        ]
-
-        hymns = merge_multipage_hymns(pages)
-
-        assert len(hymns) == 1
-        assert "First part" in hymns[0].text
-        assert "Second part" in hymns[0].text
+def _new_hymn(page_number: int, number: int, title: str, body_text: str) -> dict:
+    """Fields for a NEW_HYMN page."""
+    return {
+        "page_number": page_number,
+        "page_type": PageType.NEW_HYMN,
+        "body_text": body_text,
+        "hymn_number": number,
+        "hymn_title": title,
+    }
+
+
+def _continuation(page_number: int, **fields) -> dict:
+    """Fields for a CONTINUATION page."""
+    return {"page_number": page_number, "page_type": PageType.CONTINUATION, **fields}
+
+
+def _make_pages(page_fields: list[dict]) -> list[PageData]:
+    """Build fresh PageData instances for one test."""
+    return [PageData(**fields) for fields in page_fields]
+
+
+def _hymn_fields(**overrides) -> dict:
+    """Every Hymn field, as the merger passes them, with the given overrides."""
+    fields = {
+        "number": 1,
+        "title": "Test",
+        "text": "Line 1\nLine 2",
+        "original_number": None,
+        "style": None,
+        "offered_to": None,
+        "extra_instructions": None,
+        "repetitions": None,
+        "received_at": None,
+    }
+    fields.update(overrides)
+    return fields
+
+
+def _accumulator(fields: dict) -> _HymnAccumulator:
+    """Accumulator holding the given Hymn fields, with the text as one part."""
+    return _HymnAccumulator(
+        parts=[fields["text"]], **{key: value for key, value in fields.items() if key != "text"}
+    )
+
+
+# (page fields, expected fields per resulting hymn)
+MERGE_CASES = [
+    pytest.param(
+        [_new_hymn(2, 1, "Test Hymn", "Lyrics here")],
+        [{"number": 1, "title": "Test Hymn", "text": "Lyrics here"}],
+        id="single_page",
+    ),
+    pytest.param(
+        [_new_hymn(2, 1, "Test Hymn", "First part"), _continuation(3, body_text="Second part")],
+        [{"text": "First part\n\nSecond part"}],
+        id="two_pages",
+    ),
+    pytest.param(
+        [
+            _new_hymn(2, 1, "Hymn One", "Hymn 1 text"),
+            _new_hymn(3, 2, "Hymn Two", "Hymn 2 text"),
+            _new_hymn(4, 3, "Hymn Three", "Hymn 3 text"),
+        ],
+        [{"number": 1}, {"number": 2}, {"number": 3}],
+        id="multiple_hymns",
+    ),
+    pytest.param(
+        [
+            _new_hymn(2, 1, "Long Hymn", "Hymn 1 part 1"),
+            _continuation(3, body_text="Hymn 1 part 2"),
+            _new_hymn(4, 2, "Short Hymn", "Hymn 2 text"),
+        ],
+        [{"text": "Hymn 1 part 1\n\nHymn 1 part 2"}, {"text": "Hymn 2 text"}],
+        id="mixed",
+    ),
+    pytest.param(
+        [
+            _new_hymn(2, 1, "Test", "Part 1"),
+            _continuation(3, body_text="Part 2", received_at="2020-01-18"),
+        ],
+        [{"received_at": "2020-01-18"}],
+        id="preserves_date",
+    ),
+    pytest.param(
+        [{"page_number": 1, "page_type": PageType.COVER}, _new_hymn(2, 1, "Test", "Lyrics")],
+        [{"number": 1}],
+        id="skips_cover",
+    ),
+    pytest.param(
+        [_new_hymn(2, 1, "Test", "Lyrics"), {"page_number": 3, "page_type": PageType.BLANK}],
+        [{"number": 1}],
+        id="skips_blank",
+    ),
+    pytest.param(
+        [_new_hymn(2, 1, "  Padded  ", "  Lyrics  ")],
+        [{"title": "Padded", "text": "Lyrics"}],
+        id="strips_whitespace",
+    ),
+    pytest.param(
+        [
+            _new_hymn(2, 1, "Test", "Part 1"),
+            _continuation(3, received_at="18/01/2020"),
+            _new_hymn(4, 2, "Next", "Lyrics"),
+        ],
+        [{"number": 2}],
+        id="skips_invalid_hymn",
+    ),
+    pytest.param(
+        [
+            {**_new_hymn(2, 1, "Test", "A\nB"), "repetitions": "1-2"},
+            _continuation(3, body_text="C\nD\nE", repetitions="1-3"),
+            _continuation(4, body_text="F", repetitions="1-1"),
+        ],
+        # Offsets are the line counts so far, blank lines between pages included
+        [{"repetitions": "1-2, 7-9, 9-9"}],
+        id="offsets_repetitions",
+    ),
+]
 
-    def test_merge_multiple_hymns(self):
-        """Test merging multiple single-page hymns."""
-        pages = [
-            PageData(
-                page_number=2,
-                page_type=PageType.NEW_HYMN,
-                body_text="Hymn 1 text",
-                hymn_number=1,
-                hymn_title="Hymn One",
-            ),
-            PageData(
-                page_number=3,
-                page_type=PageType.NEW_HYMN,
-                body_text="Hymn 2 text",
-                hymn_number=2,
-                hymn_title="Hymn Two",
-            ),
-            PageData(
-                page_number=4,
-                page_type=PageType.NEW_HYMN,
-                body_text="Hymn 3 text",
-                hymn_number=3,
-                hymn_title="Hymn Three",
-            ),
-        ]
-
-        hymns = merge_multipage_hymns(pages)
-
-        assert len(hymns) == 3
-        assert hymns[0].number == 1
-        assert hymns[1].number == 2
-        assert hymns[2].number == 3
 
-    def test_merge_mixed(self):
-        """Test merging mix of single and multi-page hymns."""
-        pages = [
-            PageData(
-                page_number=2,
-                page_type=PageType.NEW_HYMN,
-                body_text="Hymn 1 part 1",
-                hymn_number=1,
-                hymn_title="Long Hymn",
-            ),
-            PageData(
-                page_number=3,
-                page_type=PageType.CONTINUATION,
-                body_text="Hymn 1 part 2",
-            ),
-            PageData(
-                page_number=4,
-                page_type=PageType.NEW_HYMN,
-                body_text="Hymn 2 text",
-                hymn_number=2,
-                hymn_title="Short Hymn",
-            ),
-        ]
-
-        hymns = merge_multipage_hymns(pages)
-
-        assert len(hymns) == 2
-        assert "Hymn 1 part 1" in hymns[0].text
-        assert "Hymn 1 part 2" in hymns[0].text
-        assert hymns[1].text == "Hymn 2 text"
+class TestMergeMultipageHymns:
+    """Tests for merge_multipage_hymns function."""
 
-    def test_merge_preserves_date(self):
-        """Test that date from continuation page is preserved."""
-        pages = [
-            PageData(
-                page_number=2,
-                page_type=PageType.NEW_HYMN,
-                body_text="Part 1",
-                hymn_number=1,
-                hymn_title="Test",
-            ),
-            PageData(
-                page_number=3,
-                page_type=PageType.CONTINUATION,
-                body_text="Part 2",
-                received_at="2020-01-18",
-            ),
-        ]
+    @pytest.mark.parametrize("page_fields,expected", MERGE_CASES)
+    def test_merge(self, page_fields, expected):
+        """Test merging page sequences into hymns."""
+        hymns = merge_multipage_hymns(_make_pages(page_fields))
+
+        assert len(hymns) == len(expected)
+        for hymn, fields in zip(hymns, expected):
+            for name, value in fields.items():
+                assert getattr(hymn, name) == value
+
+    @pytest.mark.parametrize("num_continuations", [1, 100, 500])
+    def test_merge_many_continuations(self, num_continuations):
+        """Test that every continuation page is appended in order."""
+        pages = _make_pages(
+            [_new_hymn(2, 1, "Long Hymn", "Part 0")]
+            + [_continuation(3 + i, body_text=f"Part {i + 1}") for i in range(num_continuations)]
+        )
 
         hymns = merge_multipage_hymns(pages)
 
         assert len(hymns) == 1
-        assert hymns[0].received_at == "2020-01-18"
+        assert hymns[0].text == "\n\n".join(f"Part {i}" for i in range(num_continuations + 1))
 
     def test_merge_empty_input(self):
         """Test merging empty list."""
         hymns = merge_multipage_hymns([])
         assert hymns == []
 
-    def test_merge_skips_cover(self):
-        """Test that cover pages are skipped."""
-        pages = [
-            PageData(page_number=1, page_type=PageType.COVER),
-            PageData(
-                page_number=2,
-                page_type=PageType.NEW_HYMN,
-                body_text="Lyrics",
-                hymn_number=1,
-                hymn_title="Test",
-            ),
-        ]
-
-        hymns = merge_multipage_hymns(pages)
-
-        assert len(hymns) == 1
-
-    def test_merge_skips_blank(self):
-        """Test that blank pages are skipped."""
-        pages = [
-            PageData(
-                page_number=2,
-                page_type=PageType.NEW_HYMN,
-                body_text="Lyrics",
-                hymn_number=1,
-                hymn_title="Test",
-            ),
-            PageData(page_number=3, page_type=PageType.BLANK),
-        ]
-
-        hymns = merge_multipage_hymns(pages)
-
-        assert len(hymns) == 1
-
     def test_merge_preserves_metadata(self):
         """Test that metadata is preserved."""
         pages = [
@@ -207,6 +189,54 @@ class TestMergeMultipageHymns:
         assert hymns[0].repetitions == "1-4"
 
 
+class TestHymnAccumulatorToHymn:
+    """Tests that the unvalidated fast path in to_hymn matches full validation."""
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            _hymn_fields(),
+            _hymn_fields(
+                original_number=62,
+                style="Valsa",
+                offered_to="João",
+                extra_instructions="Em pé",
+                repetitions="1-4",
+                received_at="2020-01-18",
+            ),
+            _hymn_fields(title="  Test  ", text="\n Line 1\nLine 2 \n"),
+            _hymn_fields(title="   "),
+            _hymn_fields(received_at="2020-01-18\n"),
+        ],
+        ids=["minimal", "all_fields", "padded", "whitespace_title", "date_trailing_newline"],
+    )
+    def test_to_hymn_matches_hymn(self, fields):
+        """Test that to_hymn builds the same model as Hymn(**fields)."""
+        expected = Hymn(**fields)
+
+        hymn = _accumulator(fields).to_hymn()
+
+        assert hymn.model_dump() == expected.model_dump()
+        assert hymn.model_fields_set == expected.model_fields_set
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            _hymn_fields(number=0),
+            _hymn_fields(original_number=0),
+            _hymn_fields(text=""),
+            _hymn_fields(received_at="18/01/2020"),
+        ],
+        ids=["number_0", "original_number_0", "empty_text", "bad_date"],
+    )
+    def test_to_hymn_invalid(self, fields):
+        """Test that to_hymn rejects the same inputs as Hymn(**fields)."""
+        with pytest.raises(ValidationError):
+            Hymn(**fields)
+        with pytest.raises(ValidationError):
+            _accumulator(fields).to_hymn()
+
+
 class TestCreatePageDataFromOcr:
     """Tests for create_page_data_from_ocr helper."""
 
@@ -242,6 +272,11 @@ class TestCreatePageDataFromOcr:
         assert page.hymn_number == 1
         assert page.offered_to == "X"
 
+    def test_create_invalid_page_number(self):
+        """Test that invalid fields still raise a validation error."""
+        with pytest.raises(ValidationError):
+            create_page_data_from_ocr(page_number=0, page_type=PageType.BLANK)
+
 
 class TestCountHymnsByType:
     """Tests for count_hymns_by_type function."""
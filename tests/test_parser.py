@@ -1,7 +1,10 @@
 """Tests for regex parser."""
 
+import re
+
 import pytest
 
+from hymn_ocr import parser
 from hymn_ocr.parser import (
     ParsedHeader,
     ParsedMetadata,
@@ -18,95 +21,69 @@ from hymn_ocr.parser import (
 )
 
 
-class TestParseHeader:
-    """Tests for parse_header function."""
-
-    def test_parse_header_full(self):
-        """Test parsing header with all parts."""
-        result = parse_header("01. Disciplina (62)")
-        assert result is not None
-        assert result.number == 1
-        assert result.title == "Disciplina"
-        assert result.original_number == 62
-
-    def test_parse_header_no_original(self):
-        """Test parsing header without original number."""
-        result = parse_header("05. Luz Divina")
-        assert result is not None
-        assert result.number == 5
-        assert result.title == "Luz Divina"
-        assert result.original_number is None
-
-    def test_parse_header_multiword(self):
-        """Test parsing header with multi-word title."""
-        result = parse_header("10. Santa Maria dos Céus (123)")
-        assert result is not None
-        assert result.number == 10
-        assert result.title == "Santa Maria dos Céus"
-        assert result.original_number == 123
-
-    def test_parse_header_two_digits(self):
-        """Test parsing header with two-digit number."""
-        result = parse_header("25. Hino Vinte e Cinco")
-        assert result is not None
-        assert result.number == 25
+# Artifacts clean_body_text must always remove (symbols, OCR noise, dates, extra blanks)
+_FORBIDDEN = re.compile(r"XX|WC|CC|NOINAIININN|NOIALL|\(18/01/2020\)|\n{3,}")
 
-    def test_parse_header_invalid(self):
-        """Test parsing invalid header."""
-        result = parse_header("texto qualquer")
-        assert result is None
 
-    def test_parse_header_empty(self):
-        """Test parsing empty string."""
-        result = parse_header("")
-        assert result is None
-
-    def test_parse_header_none(self):
-        """Test parsing None."""
-        result = parse_header(None)
-        assert result is None
+class TestParseHeader:
+    """Tests for parse_header function."""
 
-    def test_parse_header_with_extra_whitespace(self):
-        """Test parsing header with extra whitespace."""
-        result = parse_header("  03.   Título Com Espaços   (45)  ")
+    @pytest.mark.parametrize(
+        "text,number,title,original_number",
+        [
+            pytest.param("01. Disciplina (62)", 1, "Disciplina", 62, id="full"),
+            pytest.param("05. Luz Divina", 5, "Luz Divina", None, id="no_original"),
+            pytest.param(
+                "10. Santa Maria dos Céus (123)", 10, "Santa Maria dos Céus", 123, id="multiword"
+            ),
+            pytest.param("25. Hino Vinte e Cinco", 25, "Hino Vinte e Cinco", None, id="two_digits"),
+            pytest.param(
+                "  03.   Título Com Espaços   (45)  ",
+                3,
+                "Título Com Espaços",
+                45,
+                id="extra_whitespace",
+            ),
+        ],
+    )
+    def test_parse_header(self, text, number, title, original_number):
+        """Test parsing valid headers."""
+        result = parse_header(text)
         assert result is not None
-        assert result.number == 3
-        assert result.title == "Título Com Espaços"
-        assert result.original_number == 45
+        assert result.number == number
+        assert result.title == title
+        assert result.original_number == original_number
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param("texto qualquer", id="invalid"),
+            pytest.param("", id="empty"),
+            pytest.param(None, id="none"),
+        ],
+    )
+    def test_parse_header_no_match(self, text):
+        """Test that non-header input returns None."""
+        assert parse_header(text) is None
 
 
 class TestParseDate:
     """Tests for parse_date function."""
 
-    def test_parse_date_valid(self):
-        """Test parsing valid date."""
-        result = parse_date("(18/01/2020)")
-        assert result == "2020-01-18"
-
-    def test_parse_date_in_text(self):
-        """Test parsing date embedded in text."""
-        result = parse_date("Final (25/12/2021) aqui")
-        assert result == "2021-12-25"
-
-    def test_parse_date_invalid(self):
-        """Test parsing text without date."""
-        result = parse_date("texto sem data")
-        assert result is None
-
-    def test_parse_date_empty(self):
-        """Test parsing empty string."""
-        result = parse_date("")
-        assert result is None
-
-    def test_parse_date_none(self):
-        """Test parsing None."""
-        result = parse_date(None)
-        assert result is None
-
-    def test_parse_date_multiple_dates(self):
-        """Test parsing text with multiple dates (returns first)."""
-        result = parse_date("(01/01/2020) e (31/12/2020)")
-        assert result == "2020-01-01"
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("(18/01/2020)", "2020-01-18", id="valid"),
+            pytest.param("Final (25/12/2021) aqui", "2021-12-25", id="in_text"),
+            pytest.param("(01/01/2020) e (31/12/2020)", "2020-01-01", id="multiple_dates_first"),
+            pytest.param("texto sem data", None, id="invalid"),
+            pytest.param("", None, id="empty"),
+            pytest.param(None, None, id="none"),
+        ],
+    )
+    def test_parse_date(self, text, expected):
+        """Test parsing dates into YYYY-MM-DD."""
+        assert parse_date(text) == expected
 
 
 class TestParseOfferedTo:
@@ -156,59 +133,39 @@ class TestParseOfferedTo:
 class TestParseStyle:
     """Tests for parse_style function."""
 
-    def test_parse_style_valsa(self):
-        """Test detecting Valsa."""
-        result = parse_style("Texto - Valsa")
-        assert result == "Valsa"
-
-    def test_parse_style_marcha(self):
-        """Test detecting Marcha."""
-        result = parse_style("Texto - Marcha")
-        assert result == "Marcha"
-
-    def test_parse_style_mazurca(self):
-        """Test detecting Mazurca."""
-        result = parse_style("Texto - Mazurca")
-        assert result == "Mazurca"
-
-    def test_parse_style_bolero(self):
-        """Test detecting Bolero."""
-        result = parse_style("Texto - Bolero")
-        assert result == "Bolero"
-
-    def test_parse_style_case_insensitive(self):
-        """Test case insensitive detection."""
-        result = parse_style("Texto - VALSA")
-        assert result == "Valsa"
-
-    def test_parse_style_none(self):
-        """Test text without style."""
-        result = parse_style("Texto sem estilo")
-        assert result is None
-
-    def test_parse_style_empty(self):
-        """Test empty string."""
-        result = parse_style("")
-        assert result is None
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("Texto - Valsa", "Valsa", id="valsa"),
+            pytest.param("Texto - Marcha", "Marcha", id="marcha"),
+            pytest.param("Texto - Mazurca", "Mazurca", id="mazurca"),
+            pytest.param("Texto - Bolero", "Bolero", id="bolero"),
+            pytest.param("Texto - VALSA", "Valsa", id="case_insensitive"),
+            pytest.param("Texto sem estilo", None, id="none"),
+            pytest.param("", None, id="empty"),
+        ],
+    )
+    def test_parse_style(self, text, expected):
+        """Test detecting the musical style."""
+        assert parse_style(text) == expected
 
 
 class TestParseInstructions:
     """Tests for parse_instructions function."""
 
-    def test_parse_instructions_em_pe(self):
-        """Test detecting 'Em pé'."""
-        result = parse_instructions("Em pé")
-        assert result == "Em pé"
-
-    def test_parse_instructions_sem_instrumentos(self):
-        """Test detecting 'sem instrumentos'."""
-        result = parse_instructions("Sem instrumentos")
-        assert result == "sem instrumentos"
-
-    def test_parse_instructions_sentados(self):
-        """Test detecting 'Sentados'."""
-        result = parse_instructions("Sentados")
-        assert result == "Sentados"
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("Em pé", "Em pé", id="em_pe"),
+            pytest.param("Sem instrumentos", "sem instrumentos", id="sem_instrumentos"),
+            pytest.param("Sentados", "Sentados", id="sentados"),
+            pytest.param("Texto normal", None, id="none"),
+            pytest.param("", None, id="empty"),
+        ],
+    )
+    def test_parse_instructions(self, text, expected):
+        """Test detecting a single instruction."""
+        assert parse_instructions(text) == expected
 
     def test_parse_instructions_multiple(self):
         """Test detecting multiple instructions."""
@@ -216,16 +173,6 @@ class TestParseInstructions:
         assert "Em pé" in result
         assert "sem instrumentos" in result
 
-    def test_parse_instructions_none(self):
-        """Test text without instructions."""
-        result = parse_instructions("Texto normal")
-        assert result is None
-
-    def test_parse_instructions_empty(self):
-        """Test empty string."""
-        result = parse_instructions("")
-        assert result is None
-
 
 class TestParseMetadata:
     """Tests for parse_metadata function."""
@@ -279,90 +226,61 @@ class TestExtractPageNumber:
 class TestCleanBodyText:
     """Tests for clean_body_text function."""
 
-    def test_clean_body_text_basic(self):
-        """Test basic text cleaning."""
-        text = "Line 1\nLine 2\nLine 3"
-        result = clean_body_text(text)
-        assert result == "Line 1\nLine 2\nLine 3"
-
-    def test_clean_body_text_removes_page_numbers(self):
-        """Test that standalone numbers are removed."""
-        text = "Line 1\nLine 2\n42\nLine 3"
-        result = clean_body_text(text)
-        assert "42" not in result
-
-    def test_clean_body_text_preserves_stanza_breaks(self):
-        """Test that double newlines are preserved."""
-        text = "Stanza 1\n\nStanza 2"
-        result = clean_body_text(text)
-        assert "\n\n" in result
-
-    def test_clean_body_text_normalizes_multiple_blanks(self):
-        """Test that triple+ newlines are normalized."""
-        text = "Line 1\n\n\n\nLine 2"
-        result = clean_body_text(text)
-        assert "\n\n\n" not in result
-        assert "\n\n" in result
-
-    def test_clean_body_text_empty(self):
-        """Test empty string."""
-        result = clean_body_text("")
-        assert result == ""
-
-    def test_clean_body_text_strips(self):
-        """Test that whitespace is stripped."""
-        text = "  \n  Text  \n  "
-        result = clean_body_text(text)
-        assert result == "Text"
-
-    def test_clean_body_text_removes_symbol_xx(self):
-        """Test that XX symbol artifacts are removed."""
-        text = "Line 1\nLine 2\nXX\nLine 3"
-        result = clean_body_text(text)
-        assert "XX" not in result
-        assert "Line 1" in result
-        assert "Line 3" in result
-
-    def test_clean_body_text_removes_symbol_wc(self):
-        """Test that WC x symbol artifacts are removed."""
-        text = "Line 1\nWC x\nLine 2"
-        result = clean_body_text(text)
-        assert "WC" not in result
-
-    def test_clean_body_text_removes_symbol_cc(self):
-        """Test that CC x symbol artifacts are removed."""
-        text = "Line 1\nCC x\nLine 2"
-        result = clean_body_text(text)
-        assert "CC" not in result
-
-    def test_clean_body_text_removes_dates(self):
-        """Test that standalone dates are removed."""
-        text = "Line 1\nLine 2\n(18/01/2020)"
-        result = clean_body_text(text)
-        assert "(18/01/2020)" not in result
-
-    def test_clean_body_text_removes_repetition_markers(self):
-        """Test that | markers are removed from line starts."""
-        text = "| Line 1\n| Line 2\nLine 3"
-        result = clean_body_text(text)
-        assert "|" not in result
-        assert "Line 1" in result
-        assert "Line 2" in result
-
-    def test_clean_body_text_removes_instruction_lines(self):
-        """Test that standalone instruction lines are removed."""
-        text = "sem instrumentos\nLine 1\nLine 2"
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            pytest.param("Line 1\nLine 2\nLine 3", "Line 1\nLine 2\nLine 3", id="basic"),
+            pytest.param("", "", id="empty"),
+            pytest.param("  \n  Text  \n  ", "Text", id="strips"),
+        ],
+    )
+    def test_clean_body_text_exact(self, text, expected):
+        """Test inputs with an exact expected result."""
+        assert clean_body_text(text) == expected
+
+    @pytest.mark.parametrize(
+        "text,must_contain,must_not_contain",
+        [
+            pytest.param("Line 1\nLine 2\n42\nLine 3", [], ["42"], id="removes_page_numbers"),
+            pytest.param("Stanza 1\n\nStanza 2", ["\n\n"], [], id="preserves_stanza_breaks"),
+            pytest.param("Line 1\n\n\n\nLine 2", ["\n\n"], [], id="normalizes_multiple_blanks"),
+            pytest.param(
+                "Line 1\nLine 2\nXX\nLine 3", ["Line 1", "Line 3"], [], id="removes_symbol_xx"
+            ),
+            pytest.param("Line 1\nWC x\nLine 2", [], [], id="removes_symbol_wc"),
+            pytest.param("Line 1\nCC x\nLine 2", [], [], id="removes_symbol_cc"),
+            pytest.param("Line 1\nLine 2\n(18/01/2020)", [], [], id="removes_dates"),
+            pytest.param(
+                "| Line 1\n| Line 2\nLine 3",
+                ["Line 1", "Line 2"],
+                ["|"],
+                id="removes_repetition_markers",
+            ),
+            pytest.param(
+                "sem instrumentos\nLine 1\nLine 2",
+                ["Line 1"],
+                ["sem instrumentos"],
+                id="removes_instruction_lines",
+            ),
+            pytest.param(
+                "Line 1\n(NOINAIININN\nLine 2",
+                ["Line 1", "Line 2"],
+                [],
+                id="removes_ocr_noise",
+            ),
+            pytest.param("Line 1\nNOIALL\nLine 2", ["Line 1"], [], id="removes_gibberish"),
+        ],
+    )
+    def test_clean_body_text(self, text, must_contain, must_not_contain):
+        """Test what cleaning keeps and what it removes."""
         result = clean_body_text(text)
-        assert "sem instrumentos" not in result
-        assert "Line 1" in result
 
-    def test_clean_body_text_removes_ocr_noise(self):
-        """Test that OCR noise like (NOINAIININN is removed."""
-        text = "Line 1\n(NOINAIININN\nLine 2"
-        result = clean_body_text(text)
-        assert "NOINAIININN" not in result
-        assert "Line 1" in result
-        assert "Line 2" in result
+        # Artifacts that must never survive cleaning, checked in one pass
+        assert not _FORBIDDEN.search(result)
+        for part in must_contain:
+            assert part in result
+        for part in must_not_contain:
+            assert part not in result
 
     def test_clean_body_text_removes_single_char(self):
         """Test that single character lines are removed."""
@@ -374,13 +292,6 @@ class TestCleanBodyText:
         assert "Line 1" in result
         assert "Line 2" in result
 
-    def test_clean_body_text_removes_gibberish(self):
-        """Test that gibberish lines are removed."""
-        text = "Line 1\nNOIALL\nLine 2"
-        result = clean_body_text(text)
-        assert "NOIALL" not in result
-        assert "Line 1" in result
-
 
 class TestHasPatterns:
     """Tests for pattern detection functions."""
@@ -400,3 +311,13 @@ class TestHasPatterns:
     def test_has_date_pattern_false(self):
         """Test date pattern not present."""
         assert has_date_pattern("No date here") is False
+
+    def test_parser_patterns_precompiled(self):
+        """Test that every module-level *_PATTERN is a compiled regex."""
+        patterns = {
+            name: value for name, value in vars(parser).items() if name.endswith("_PATTERN")
+        }
+
+        assert patterns
+        for name, value in patterns.items():
+            assert isinstance(value, re.Pattern), name
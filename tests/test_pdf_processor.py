@@ -4,6 +4,7 @@ from pathlib import Path
 import tempfile
 
 import pytest
+from pdf2image import pdfinfo_from_path
 from PIL import Image
 
 from hymn_ocr.pdf_processor import (
@@ -13,12 +14,18 @@ from hymn_ocr.pdf_processor import (
 )
 
 
+def _page_size_points(pdf_path: Path) -> tuple[float, float]:
+    """Page size of a PDF in points, as reported by pdfinfo (e.g. "419.53 x 595.28 pts")."""
+    width, _, height = pdfinfo_from_path(str(pdf_path))["Page size"].split()[:3]
+    return float(width), float(height)
+
+
 class TestConvertPdfToImages:
     """Tests for convert_pdf_to_images function."""
 
-    def test_convert_pdf_returns_images(self, sample_pdf_path: Path):
+    def test_convert_pdf_returns_images(self, tiny_pdf_path: Path):
         """Test that PDF conversion returns list of PIL Images."""
-        images = convert_pdf_to_images(sample_pdf_path, dpi=72)
+        images = convert_pdf_to_images(tiny_pdf_path, dpi=72)
         assert isinstance(images, list)
         assert len(images) > 0
         assert all(isinstance(img, Image.Image) for img in images)
@@ -30,44 +37,47 @@ class TestConvertPdfToImages:
         )
         assert len(images) == 3
 
-    def test_convert_single_page(self, sample_pdf_path: Path):
+    def test_convert_single_page(self, tiny_pdf_path: Path, cached_convert):
         """Test converting a single page."""
-        images = convert_pdf_to_images(
-            sample_pdf_path, dpi=72, first_page=1, last_page=1
-        )
+        images = cached_convert(tiny_pdf_path, dpi=72, first_page=1, last_page=1)
         assert len(images) == 1
 
-    def test_convert_dpi_affects_size(self, sample_pdf_path: Path):
+    def test_convert_dpi_matches_page_size(self, sample_pdf_path: Path, cached_convert):
+        """Test that rendered size follows the page size in points (1 pt = 1 px at 72 DPI)."""
+        images_72 = cached_convert(sample_pdf_path, dpi=72, first_page=1, last_page=1)
+        width_pt, height_pt = _page_size_points(sample_pdf_path)
+
+        width, height = images_72[0].size
+        assert abs(width - width_pt) <= 1
+        assert abs(height - height_pt) <= 1
+
+    @pytest.mark.slow
+    def test_convert_dpi_affects_size(self, sample_pdf_path: Path, cached_convert):
         """Test that higher DPI produces larger images."""
-        images_72 = convert_pdf_to_images(
-            sample_pdf_path, dpi=72, first_page=1, last_page=1
-        )
-        images_150 = convert_pdf_to_images(
-            sample_pdf_path, dpi=150, first_page=1, last_page=1
-        )
+        images_72 = cached_convert(sample_pdf_path, dpi=72, first_page=1, last_page=1)
+        images_150 = cached_convert(sample_pdf_path, dpi=150, first_page=1, last_page=1)
 
-        # Higher DPI should result in larger image
-        size_72 = images_72[0].width * images_72[0].height
-        size_150 = images_150[0].width * images_150[0].height
-        assert size_150 > size_72
+        # Higher DPI should result in a larger image in both dimensions
+        w72, h72 = images_72[0].size
+        w150, h150 = images_150[0].size
+        assert w150 > w72 and h150 > h72
 
     def test_convert_nonexistent_file(self):
         """Test that FileNotFoundError is raised for missing file."""
         with pytest.raises(FileNotFoundError):
             convert_pdf_to_images("/nonexistent/path/file.pdf")
 
-    def test_convert_non_pdf_file(self, images_dir: Path):
+    def test_convert_non_pdf_file(self, tmp_path: Path):
         """Test that ValueError is raised for non-PDF file."""
-        # Use an existing image file as non-PDF
-        image_file = images_dir / "page_01.png"
-        if image_file.exists():
-            with pytest.raises(ValueError) as exc_info:
-                convert_pdf_to_images(image_file)
-            assert "not a PDF" in str(exc_info.value)
-
-    def test_convert_accepts_string_path(self, sample_pdf_path: Path):
+        image_file = tmp_path / "page.png"
+        image_file.write_bytes(b"not a pdf\n")
+
+        with pytest.raises(ValueError, match="not a PDF"):
+            convert_pdf_to_images(image_file)
+
+    def test_convert_accepts_string_path(self, tiny_pdf_path: Path):
         """Test that string paths are accepted."""
-        images = convert_pdf_to_images(str(sample_pdf_path), dpi=72, first_page=1, last_page=1)
+        images = convert_pdf_to_images(str(tiny_pdf_path), dpi=72, first_page=1, last_page=1)
         assert len(images) == 1
 
 
@@ -88,13 +98,15 @@ class TestGetPageCount:
 class TestSavePageAsImage:
     """Tests for save_page_as_image function."""
 
-    def test_save_page_creates_file(self, sample_pdf_path: Path):
+    def test_save_page_creates_file(self, tiny_pdf_path: Path, cached_convert, monkeypatch):
         """Test that save_page_as_image creates an image file."""
+        # Save logic is exercised for real; the page render comes from the session cache
+        monkeypatch.setattr("hymn_ocr.pdf_processor.convert_pdf_to_images", cached_convert)
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
             output_path = Path(f.name)
 
         try:
-            result = save_page_as_image(sample_pdf_path, 1, output_path, dpi=72)
+            result = save_page_as_image(tiny_pdf_path, 1, output_path, dpi=72)
             assert result == output_path
             assert output_path.exists()
 
@@ -105,13 +117,13 @@ class TestSavePageAsImage:
         finally:
             output_path.unlink(missing_ok=True)
 
-    def test_save_page_returns_path(self, sample_pdf_path: Path):
+    def test_save_page_returns_path(self, tiny_pdf_path: Path):
         """Test that save_page_as_image returns the output path."""
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
             output_path = Path(f.name)
 
         try:
-            result = save_page_as_image(sample_pdf_path, 2, output_path, dpi=72)
+            result = save_page_as_image(tiny_pdf_path, 1, output_path, dpi=72)
             assert isinstance(result, Path)
             assert result.exists()
         finally:
@@ -2,7 +2,6 @@
 
 import numpy as np
 import pytest
-from PIL import Image
 
 from hymn_ocr.repetition_detector import (
     VerticalSegment,
@@ -12,7 +11,62 @@ from hymn_ocr.repetition_detector import (
     find_line_at_y,
     merge_overlapping_segments,
 )
-from hymn_ocr.zone_detector import detect_zones, pil_to_cv2
+from hymn_ocr.zone_detector import PageZones
+
+
+# merge_overlapping_segments inputs, built once at import (the merge never mutates them)
+_OVERLAPPING = (
+    VerticalSegment(x=50, y_start=100, y_end=200),
+    VerticalSegment(x=52, y_start=190, y_end=300),
+)
+_ADJACENT = (
+    VerticalSegment(x=50, y_start=100, y_end=200),
+    VerticalSegment(x=50, y_start=210, y_end=300),  # 10px gap
+)
+_SEPARATE = (
+    VerticalSegment(x=50, y_start=100, y_end=150),
+    VerticalSegment(x=50, y_start=250, y_end=300),  # Large gap
+)
+
+
+# Left margin limit of the 800px-wide canvas (LEFT_MARGIN_PERCENT = 0.15)
+_LEFT_MARGIN_MAX = 120
+
+# find_line_at_y inputs: (y_start, y_end, text) per line
+_TEXT_LINES = (
+    (100, 120, "Line 1"),
+    (130, 150, "Line 2"),
+    (160, 180, "Line 3"),
+)
+_GAPPED_TEXT_LINES = (
+    (100, 120, "Line 1"),
+    (180, 200, "Line 2"),
+)
+
+
+@pytest.fixture(scope="module")
+def blank_canvas() -> np.ndarray:
+    """Read-only white 500x800 grayscale canvas; copy it before drawing."""
+    canvas = np.full((500, 800), 255, dtype=np.uint8)
+    canvas.setflags(write=False)
+    return canvas
+
+
+# Synthetic scenarios: (rows, cols) regions painted black on the blank canvas
+_SYNTHETIC_SCENARIOS = {
+    "blank": (),
+    "left_bar": ((slice(100, 200), slice(50, 52)),),  # Vertical line at x=50
+}
+
+
+@pytest.fixture(scope="module")
+def synthetic(request: pytest.FixtureRequest, blank_canvas: np.ndarray) -> np.ndarray:
+    """Read-only canvas for a named scenario, built once per module (parametrize indirectly)."""
+    img = blank_canvas.copy()
+    for rows, cols in _SYNTHETIC_SCENARIOS[request.param]:
+        img[rows, cols] = 0
+    img.setflags(write=False)
+    return img
 
 
 class TestVerticalSegment:
@@ -29,11 +83,11 @@ class TestVerticalSegment:
 class TestDetectVerticalLines:
     """Tests for detect_vertical_lines function."""
 
-    def test_detect_vertical_line(self):
+    def test_detect_vertical_line(self, blank_canvas: np.ndarray):
         """Test detecting a vertical line."""
         # Create image with vertical line in left margin
-        img = np.ones((500, 800, 3), dtype=np.uint8) * 255
-        img[100:300, 50:52, :] = 0  # Vertical line at x=50
+        img = blank_canvas.copy()
+        img[100:300, 50:52] = 0  # Vertical line at x=50
 
         segments = detect_vertical_lines(img)
 
@@ -47,130 +101,106 @@ class TestDetectVerticalLines:
                 break
         assert found, f"Expected vertical line near x=50, got {segments}"
 
-    def test_detect_no_vertical_lines(self):
-        """Test with image without vertical lines."""
-        img = np.ones((500, 800, 3), dtype=np.uint8) * 255
+    def test_detect_multiple_vertical_lines(self, blank_canvas: np.ndarray):
+        """Test detecting several bars drawn with one fancy-indexing store."""
+        img = blank_canvas.copy()
+        ys = np.r_[100:300]
+        xs = np.array([30, 31, 90, 91])  # Two 2px bars at x=30 and x=90
+        img[ys[:, None], xs[None, :]] = 0
+
         segments = detect_vertical_lines(img)
+
+        for bar_x in (30, 90):
+            assert any(
+                abs(seg.x - bar_x) < 10 and seg.y_start < 150 < seg.y_end for seg in segments
+            ), f"Expected vertical line near x={bar_x}, got {segments}"
+
+    def test_detect_vertical_line_bgr(self, blank_canvas: np.ndarray):
+        """Test that BGR input gives the same segments as grayscale input."""
+        img = blank_canvas.copy()
+        img[100:300, 50:52] = 0
+
+        bgr = np.repeat(img[:, :, np.newaxis], 3, axis=2)
+
+        assert detect_vertical_lines(bgr) == detect_vertical_lines(img)
+
+    @pytest.mark.parametrize("synthetic", ["blank"], indirect=True)
+    def test_detect_no_vertical_lines(self, synthetic: np.ndarray):
+        """Test with image without vertical lines."""
+        segments = detect_vertical_lines(synthetic)
         assert len(segments) == 0
 
-    def test_detect_ignores_right_margin(self):
+    def test_detect_ignores_right_margin(self, blank_canvas: np.ndarray):
         """Test that vertical lines in right margin are ignored."""
         # Create image with vertical line in right margin
-        img = np.ones((500, 800, 3), dtype=np.uint8) * 255
-        img[100:300, 700:702, :] = 0  # Vertical line at x=700 (right side)
+        img = blank_canvas.copy()
+        img[100:300, 700:702] = 0  # Vertical line at x=700 (right side)
 
         segments = detect_vertical_lines(img)
 
         # Should not detect lines in right margin
-        for seg in segments:
-            assert seg.x < 800 * 0.15, f"Detected line in right margin at x={seg.x}"
+        max_x = max((seg.x for seg in segments), default=0)
+        assert max_x < _LEFT_MARGIN_MAX, f"Detected line in right margin at x={max_x}"
 
 
 class TestMergeOverlappingSegments:
     """Tests for merge_overlapping_segments function."""
 
-    def test_merge_overlapping(self):
-        """Test merging overlapping segments."""
-        segments = [
-            VerticalSegment(x=50, y_start=100, y_end=200),
-            VerticalSegment(x=52, y_start=190, y_end=300),
-        ]
-        merged = merge_overlapping_segments(segments)
-
-        assert len(merged) == 1
-        assert merged[0].y_start == 100
-        assert merged[0].y_end == 300
-
-    def test_merge_adjacent(self):
-        """Test merging adjacent segments."""
-        segments = [
-            VerticalSegment(x=50, y_start=100, y_end=200),
-            VerticalSegment(x=50, y_start=210, y_end=300),  # 10px gap
-        ]
-        merged = merge_overlapping_segments(segments)
-
-        # Should merge due to small gap
-        assert len(merged) == 1
+    @pytest.mark.parametrize(
+        "segments,expected_spans",
+        [
+            pytest.param(_OVERLAPPING, [(100, 300)], id="overlapping"),
+            # Merged due to the small (10px) gap
+            pytest.param(_ADJACENT, [(100, 300)], id="adjacent"),
+            pytest.param(_SEPARATE, [(100, 150), (250, 300)], id="separate"),
+            pytest.param((), [], id="empty"),
+        ],
+    )
+    def test_merge(self, segments, expected_spans):
+        """Test merging overlapping or adjacent segments."""
+        merged = merge_overlapping_segments(list(segments))
 
-    def test_no_merge_separate(self):
-        """Test that separate segments are not merged."""
-        segments = [
-            VerticalSegment(x=50, y_start=100, y_end=150),
-            VerticalSegment(x=50, y_start=250, y_end=300),  # Large gap
-        ]
-        merged = merge_overlapping_segments(segments)
-
-        assert len(merged) == 2
-
-    def test_merge_empty(self):
-        """Test with empty list."""
-        merged = merge_overlapping_segments([])
-        assert merged == []
+        assert [(seg.y_start, seg.y_end) for seg in merged] == expected_spans
 
 
 class TestFindLineAtY:
     """Tests for find_line_at_y function."""
 
-    def test_find_line_exact(self):
-        """Test finding line at exact y coordinate."""
-        text_lines = [
-            (100, 120, "Line 1"),
-            (130, 150, "Line 2"),
-            (160, 180, "Line 3"),
-        ]
-        result = find_line_at_y(text_lines, 110)
-        assert result == 1
-
-    def test_find_line_between(self):
-        """Test finding line between two lines with larger gap."""
-        text_lines = [
-            (100, 120, "Line 1"),
-            (180, 200, "Line 2"),  # Gap larger than tolerance (20px)
-        ]
-        result = find_line_at_y(text_lines, 150)
-        # Should return the next line since 150 is before line 2 starts
-        assert result == 2
-
-    def test_find_line_below_all(self):
-        """Test finding line below all lines."""
-        text_lines = [
-            (100, 120, "Line 1"),
-            (130, 150, "Line 2"),
-        ]
-        result = find_line_at_y(text_lines, 200)
-        # Should return last line
-        assert result == 2
-
-    def test_find_line_empty(self):
-        """Test with empty text lines."""
-        result = find_line_at_y([], 100)
-        assert result is None
+    @pytest.mark.parametrize(
+        "text_lines,y,expected",
+        [
+            pytest.param(_TEXT_LINES, 110, 1, id="exact"),
+            # Gap larger than tolerance (20px): 150 is before line 2 starts
+            pytest.param(_GAPPED_TEXT_LINES, 150, 2, id="between"),
+            # Below all lines: the last line is returned
+            pytest.param(_TEXT_LINES[:2], 200, 2, id="below_all"),
+            pytest.param((), 100, None, id="empty"),
+        ],
+    )
+    def test_find_line(self, text_lines, y, expected):
+        """Test mapping a y coordinate to a 1-indexed line number."""
+        assert find_line_at_y(list(text_lines), y) == expected
 
 
 class TestDetectRepetitionBars:
     """Tests for detect_repetition_bars function."""
 
-    def test_detect_bars_with_image(self, first_hymn_image: Image.Image):
+    def test_detect_bars_with_image(self, first_hymn_cv2: np.ndarray):
         """Test detecting repetition bars in a hymn image."""
-        cv2_img = pil_to_cv2(first_hymn_image)
-        result = detect_repetition_bars(cv2_img)
+        result = detect_repetition_bars(first_hymn_cv2)
 
         # Result should be string or None
         assert result is None or isinstance(result, str)
 
-    def test_detect_no_bars(self):
+    @pytest.mark.parametrize("synthetic", ["blank"], indirect=True)
+    def test_detect_no_bars(self, synthetic: np.ndarray):
         """Test with image without bars."""
-        # Create blank white image
-        img = np.ones((500, 800, 3), dtype=np.uint8) * 255
-        result = detect_repetition_bars(img)
+        result = detect_repetition_bars(synthetic)
         assert result is None
 
-    def test_detect_bars_with_text_lines(self):
+    @pytest.mark.parametrize("synthetic", ["left_bar"], indirect=True)
+    def test_detect_bars_with_text_lines(self, synthetic: np.ndarray):
         """Test detecting bars with text line mapping."""
-        # Create image with vertical line
-        img = np.ones((500, 800, 3), dtype=np.uint8) * 255
-        img[100:200, 50:52, :] = 0
-
         text_lines = [
             (90, 110, "Line 1"),
             (120, 140, "Line 2"),
@@ -178,7 +208,7 @@ class TestDetectRepetitionBars:
             (180, 200, "Line 4"),
         ]
 
-        result = detect_repetition_bars(img, text_lines=text_lines)
+        result = detect_repetition_bars(synthetic, text_lines=text_lines)
 
         # Should detect and map to lines
         if result:
@@ -199,41 +229,71 @@ class TestAdjustRepetitionNumbers:
         assert result == "1-4"
 
     def test_adjust_both(self):
-        """Test adjustment with both prev and new."""
+        """Test that new ranges are offset by the line count of the previous text."""
         prev = "1-4"
         new = "1-2"
         text = "Line 1\nLine 2\nLine 3\nLine 4\n\nLine 5\nLine 6"
 
         result = adjust_repetition_numbers(prev, new, text)
 
-        # Should combine both
-        assert "1-4" in result
-        # New should be offset
-        assert "," in result
+        # 7 lines before, so 1-2 becomes 8-9
+        assert result == "1-4, 8-9"
+
+    def test_adjust_prev_line_count(self):
+        """Test that a known line count is used instead of the text."""
+        result = adjust_repetition_numbers("1-4", "1-2", prev_line_count=7)
+        assert result == "1-4, 8-9"
 
     def test_adjust_preserves_format(self):
         """Test that format is preserved."""
         result = adjust_repetition_numbers("1-4", "5-8", "")
         assert "-" in result
 
+    @pytest.mark.parametrize(
+        "prev, new, text, expected",
+        [
+            ("", "1-2", "Line", "1-2"),
+            ("1-4", "", "Line", "1-4"),
+            ("1-4", "1-2", "", "1-4, 2-3"),
+            # Ranges without a space after the comma
+            ("1-4", "1-4,5-8", "A\nB", "1-4, 3-6, 7-10"),
+            # Unparseable parts are kept as-is
+            ("1-4", "x, 2-3", "A\nB", "1-4, x, 4-5"),
+            ("1-4", "12", "A", "1-4, 12"),
+            # Surrounding whitespace is stripped
+            ("1-4", " 3-5 ", "A\n\nB", "1-4, 6-8"),
+            # A trailing newline counts as one more line
+            ("1-4", "1-2", "A\nB\n", "1-4, 4-5"),
+        ],
+        ids=[
+            "empty-prev",
+            "empty-new",
+            "empty-text",
+            "no-space",
+            "unparseable",
+            "single-number",
+            "padded",
+            "trailing-newline",
+        ],
+    )
+    def test_adjust_edge_cases(self, prev, new, text, expected):
+        """Test edge-case inputs against hand-checked results."""
+        assert adjust_repetition_numbers(prev, new, text) == expected
+
 
 class TestIntegration:
     """Integration tests for repetition detection."""
 
-    def test_detect_in_hymn_body(self, first_hymn_image: Image.Image):
+    def test_detect_in_hymn_body(self, first_hymn_cv2: np.ndarray, first_hymn_zones: PageZones):
         """Test detecting repetition bars in hymn body zone."""
-        cv2_img = pil_to_cv2(first_hymn_image)
-        zones = detect_zones(cv2_img)
-
-        if zones.body:
-            result = detect_repetition_bars(cv2_img, zone=zones.body)
+        if first_hymn_zones.body:
+            result = detect_repetition_bars(first_hymn_cv2, zone=first_hymn_zones.body)
             # Result may or may not have bars
             assert result is None or isinstance(result, str)
 
-    def test_continuation_page_no_bars(self, continuation_image: Image.Image):
+    def test_continuation_page_no_bars(self, continuation_cv2: np.ndarray):
         """Test that continuation pages may have different bar patterns."""
-        cv2_img = pil_to_cv2(continuation_image)
-        result = detect_repetition_bars(cv2_img)
+        result = detect_repetition_bars(continuation_cv2)
 
         # Just check it runs without error
         assert result is None or isinstance(result, str)
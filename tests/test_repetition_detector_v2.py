@@ -0,0 +1,101 @@
+"""Tests for projection-profile repetition bar detector."""
+
+import numpy as np
+import pytest
+
+from hymn_ocr.repetition_detector_v2 import (
+    get_line_boundaries_tesseract,
+    map_y_to_line_tesseract,
+    map_ys_to_lines_tesseract,
+)
+
+
+# Three lines with centers at y=20, 50 and 80
+_LINES = np.array([(10, 30), (40, 60), (70, 90)], dtype=np.int32)
+# The first line overlaps the second and reaches further down
+_OVERLAPPING_LINES = np.array([(10, 50), (30, 40), (60, 80)], dtype=np.int32)
+_NO_LINES = np.empty((0, 2), dtype=np.int32)
+
+
+class TestMapYToLineTesseract:
+    """Tests for map_y_to_line_tesseract and map_ys_to_lines_tesseract."""
+
+    @pytest.mark.parametrize(
+        "y, line_boundaries, is_end, expected",
+        [
+            (50, _NO_LINES, False, 1),
+            (50, _NO_LINES, True, 1),
+            (0, _LINES, False, 1),
+            (0, _LINES, True, 1),
+            # Bar start: the line is included on either side of its center
+            (15, _LINES, False, 1),
+            (25, _LINES, False, 1),
+            (35, _LINES, False, 2),
+            # Bar end: the line is included only past its center
+            (45, _LINES, True, 1),
+            (55, _LINES, True, 2),
+            (35, _LINES, True, 1),
+            (100, _LINES, False, 3),
+            (100, _LINES, True, 3),
+            (45, _OVERLAPPING_LINES, False, 1),
+            (45, _OVERLAPPING_LINES, True, 1),
+            (55, _OVERLAPPING_LINES, False, 3),
+            (55, _OVERLAPPING_LINES, True, 2),
+        ],
+        ids=[
+            "empty-start",
+            "empty-end",
+            "before-first-start",
+            "before-first-end",
+            "start-before-center",
+            "start-after-center",
+            "start-in-gap",
+            "end-before-center",
+            "end-after-center",
+            "end-in-gap",
+            "past-last-start",
+            "past-last-end",
+            "overlapping-start",
+            "overlapping-end",
+            "overlapping-later-start",
+            "overlapping-later-end",
+        ],
+    )
+    def test_map_y_to_line(self, y, line_boundaries, is_end, expected):
+        """Test single and vectorized mapping agree on hand-checked line numbers."""
+        assert map_y_to_line_tesseract(y, line_boundaries, is_end=is_end) == expected
+
+        lines = map_ys_to_lines_tesseract([y, y], line_boundaries, is_end=is_end)
+        assert lines.tolist() == [expected, expected]
+
+
+class TestGetLineBoundariesTesseract:
+    """Tests for get_line_boundaries_tesseract function."""
+
+    def test_empty_image(self):
+        """Test that an empty image yields an empty (0, 2) array."""
+        result = get_line_boundaries_tesseract(np.empty((0, 0, 3), dtype=np.uint8))
+
+        assert result.shape == (0, 2)
+        assert result.dtype == np.int32
+
+    def test_lines_sorted_by_top(self, monkeypatch):
+        """Test that OCR lines come back as a sorted (N, 2) int32 array."""
+
+        def fake_image_to_data(image, lang=None, config=None, output_type=None):
+            return {
+                "text": ["Segunda", "linha", "Primeira", "linha"],
+                "block_num": [1, 1, 1, 1],
+                "par_num": [1, 1, 1, 1],
+                "line_num": [2, 2, 1, 1],
+                "top": [50, 52, 10, 12],
+                "height": [20, 20, 20, 20],
+            }
+
+        monkeypatch.setattr("pytesseract.image_to_data", fake_image_to_data)
+
+        result = get_line_boundaries_tesseract(np.full((100, 200, 3), 255, dtype=np.uint8))
+
+        assert result.shape == (2, 2)
+        assert result.dtype == np.int32
+        assert result.tolist() == [[10, 32], [50, 72]]
@@ -1,6 +1,5 @@
 """Tests for YAML generator."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -51,14 +50,20 @@ class TestHymnToDict:
         assert "style" not in result
         assert "offered_to" not in result
 
+    def test_hymn_to_dict_plain_values(self, valid_hymn_data: dict):
+        """Test that multiline text comes back as a plain str usable by safe_dump."""
+        result = hymn_to_dict(Hymn(**valid_hymn_data))
+
+        assert type(result["text"]) is str
+        assert yaml.safe_load(yaml.safe_dump(result, allow_unicode=True)) == result
+
 
 class TestHymnbookToDict:
     """Tests for hymnbook_to_dict function."""
 
-    def test_hymnbook_to_dict(self, valid_hymnbook_data: dict):
+    def test_hymnbook_to_dict(self, valid_hymnbook: HymnBook):
         """Test converting hymnbook to dict."""
-        hymnbook = HymnBook(**valid_hymnbook_data)
-        result = hymnbook_to_dict(hymnbook)
+        result = hymnbook_to_dict(valid_hymnbook)
 
         assert result["name"] == "Seleção Aniversário Ingrid"
         assert result["owner_name"] == "Ingrid"
@@ -81,10 +86,9 @@ class TestHymnbookToDict:
 class TestGenerateYaml:
     """Tests for generate_yaml function."""
 
-    def test_generate_yaml_valid(self, valid_hymnbook_data: dict):
+    def test_generate_yaml_valid(self, valid_hymnbook: HymnBook):
         """Test generating valid YAML."""
-        hymnbook = HymnBook(**valid_hymnbook_data)
-        yaml_str = generate_yaml(hymnbook)
+        yaml_str = generate_yaml(valid_hymnbook)
 
         assert isinstance(yaml_str, str)
         assert len(yaml_str) > 0
@@ -93,16 +97,21 @@ class TestGenerateYaml:
         data = yaml.safe_load(yaml_str)
         assert data["name"] == "Seleção Aniversário Ingrid"
 
-    def test_generate_yaml_structure(self, valid_hymnbook_data: dict):
+    def test_generate_yaml_structure(self, valid_hymnbook: HymnBook):
         """Test YAML structure."""
-        hymnbook = HymnBook(**valid_hymnbook_data)
-        yaml_str = generate_yaml(hymnbook)
+        yaml_str = generate_yaml(valid_hymnbook)
 
         data = yaml.safe_load(yaml_str)
         assert "name" in data
         assert "owner_name" in data
         assert "hymns" in data
 
+    def test_generate_yaml_matches_dict(self, valid_hymnbook: HymnBook):
+        """Test that the direct representers emit the same data as hymnbook_to_dict."""
+        yaml_str = generate_yaml(valid_hymnbook)
+
+        assert yaml.safe_load(yaml_str) == hymnbook_to_dict(valid_hymnbook)
+
     def test_generate_yaml_unicode(self):
         """Test that unicode is preserved."""
         hymn = Hymn(
@@ -133,82 +142,73 @@ class TestGenerateYaml:
         yaml_str = generate_yaml(hymnbook)
 
         # Multiline should use block scalar style
+        assert "text: |" in yaml_str
         assert "Line 1" in yaml_str
         assert "Line 2" in yaml_str
 
+    def test_generate_yaml_multiline_non_bmp(self, tmp_path: Path):
+        """Test that text with characters outside the BMP keeps block style."""
+        hymn = Hymn(number=1, title="Estrela", text="Linha um 🌟\nLinha dois")
+        hymnbook = HymnBook(name="Test", owner_name="Owner", hymns=[hymn])
+
+        yaml_str = generate_yaml(hymnbook)
+
+        assert "text: |" in yaml_str
+        assert "Linha um 🌟" in yaml_str
+
+        # Round-trips through the file API unchanged
+        output_path = save_yaml(hymnbook, tmp_path / "book.yaml")
+        assert load_yaml(output_path).hymns[0].text == hymn.text
+
 
 class TestSaveYaml:
     """Tests for save_yaml function."""
 
-    def test_save_yaml_creates_file(self, valid_hymnbook_data: dict):
+    def test_save_yaml_creates_file(self, tmp_path: Path, valid_hymnbook: HymnBook):
         """Test that save_yaml creates a file."""
-        hymnbook = HymnBook(**valid_hymnbook_data)
+        output_path = tmp_path / "book.yaml"
 
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-            output_path = Path(f.name)
+        result = save_yaml(valid_hymnbook, output_path)
 
-        try:
-            result = save_yaml(hymnbook, output_path)
+        assert result == output_path
+        assert output_path.exists()
+        assert output_path.stat().st_size > 0
 
-            assert result == output_path
-            assert output_path.exists()
-            assert output_path.stat().st_size > 0
-        finally:
-            output_path.unlink(missing_ok=True)
-
-    def test_save_yaml_content(self, valid_hymnbook_data: dict):
+    def test_save_yaml_content(self, tmp_path: Path, valid_hymnbook: HymnBook):
         """Test saved YAML content."""
-        hymnbook = HymnBook(**valid_hymnbook_data)
-
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-            output_path = Path(f.name)
+        output_path = tmp_path / "book.yaml"
 
-        try:
-            save_yaml(hymnbook, output_path)
+        save_yaml(valid_hymnbook, output_path)
 
-            content = output_path.read_text(encoding="utf-8")
-            data = yaml.safe_load(content)
+        content = output_path.read_text(encoding="utf-8")
+        data = yaml.safe_load(content)
 
-            assert data["name"] == "Seleção Aniversário Ingrid"
-        finally:
-            output_path.unlink(missing_ok=True)
+        assert data["name"] == "Seleção Aniversário Ingrid"
 
 
 class TestLoadYaml:
     """Tests for load_yaml function."""
 
-    def test_load_yaml(self, valid_hymnbook_data: dict):
+    def test_load_yaml(self, tmp_path: Path, valid_hymnbook: HymnBook):
         """Test loading YAML file."""
-        hymnbook = HymnBook(**valid_hymnbook_data)
-
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-            output_path = Path(f.name)
+        output_path = tmp_path / "book.yaml"
 
-        try:
-            save_yaml(hymnbook, output_path)
-            loaded = load_yaml(output_path)
+        save_yaml(valid_hymnbook, output_path)
+        loaded = load_yaml(output_path)
 
-            assert loaded.name == hymnbook.name
-            assert loaded.owner_name == hymnbook.owner_name
-            assert len(loaded.hymns) == len(hymnbook.hymns)
-        finally:
-            output_path.unlink(missing_ok=True)
+        assert loaded.name == valid_hymnbook.name
+        assert loaded.owner_name == valid_hymnbook.owner_name
+        assert len(loaded.hymns) == len(valid_hymnbook.hymns)
 
-    def test_load_yaml_hymns(self, valid_hymnbook_data: dict):
+    def test_load_yaml_hymns(self, tmp_path: Path, valid_hymnbook: HymnBook):
         """Test that loaded hymns are correct."""
-        hymnbook = HymnBook(**valid_hymnbook_data)
+        output_path = tmp_path / "book.yaml"
 
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as f:
-            output_path = Path(f.name)
+        save_yaml(valid_hymnbook, output_path)
+        loaded = load_yaml(output_path)
 
-        try:
-            save_yaml(hymnbook, output_path)
-            loaded = load_yaml(output_path)
-
-            assert loaded.hymns[0].number == hymnbook.hymns[0].number
-            assert loaded.hymns[0].title == hymnbook.hymns[0].title
-        finally:
-            output_path.unlink(missing_ok=True)
+        assert loaded.hymns[0].number == valid_hymnbook.hymns[0].number
+        assert loaded.hymns[0].title == valid_hymnbook.hymns[0].title
 
 
 class TestPreviewYaml:
@@ -216,8 +216,9 @@ class TestPreviewYaml:
 
     def test_preview_yaml(self, minimal_hymn_data: dict):
         """Test preview generation."""
+        # Known-valid data, so skip per-hymn validation
         hymns = [
-            Hymn(**{**minimal_hymn_data, "number": i, "title": f"Hymn {i}"})
+            Hymn.model_construct(**{**minimal_hymn_data, "number": i, "title": f"Hymn {i}"})
             for i in range(1, 11)
         ]
         hymnbook = HymnBook(name="Test", owner_name="Owner", hymns=hymns)
@@ -234,10 +235,15 @@ class TestPreviewYaml:
 
     def test_preview_yaml_all_hymns(self, minimal_hymn_data: dict):
         """Test preview with fewer hymns than max."""
-        hymns = [Hymn(**minimal_hymn_data)]
+        hymns = [Hymn.model_construct(**minimal_hymn_data)]
         hymnbook = HymnBook(name="Test", owner_name="Owner", hymns=hymns)
 
         preview = preview_yaml(hymnbook, max_hymns=5)
 
         # Should not mention "more hymns"
         assert "more hymns" not in preview
+
+    def test_preview_yaml_zero_hymns(self, valid_hymnbook: HymnBook):
+        """Test that a preview without hymns is rejected like an empty HymnBook."""
+        with pytest.raises(ValueError, match="at least one hymn"):
+            preview_yaml(valid_hymnbook, max_hymns=0)